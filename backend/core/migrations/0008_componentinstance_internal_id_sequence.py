@@ -0,0 +1,35 @@
+# Generated by Django 4.2.18 on 2026-10-15 09:00
+
+import core.models.instance
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_connection_connection_prevent_duplicate_connections'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='componentinstance',
+            name='internal_id',
+            field=core.models.instance.InternalIdField(blank=True, db_index=True, editable=False, help_text='Internal sequential identifier for performance optimization', unique=True),
+        ),
+        # Hand the internal_id counter to a PostgreSQL sequence, starting after
+        # the highest value already in use.
+        migrations.RunSQL(
+            sql=[
+                'CREATE SEQUENCE IF NOT EXISTS et_component_instance_internal_id_seq '
+                'OWNED BY et_component_instance.internal_id;',
+                "SELECT setval('et_component_instance_internal_id_seq', "
+                'COALESCE((SELECT MAX(internal_id) FROM et_component_instance), 0) + 1, false);',
+                'ALTER TABLE et_component_instance ALTER COLUMN internal_id '
+                "SET DEFAULT nextval('et_component_instance_internal_id_seq');",
+            ],
+            reverse_sql=[
+                'ALTER TABLE et_component_instance ALTER COLUMN internal_id DROP DEFAULT;',
+                'DROP SEQUENCE IF EXISTS et_component_instance_internal_id_seq;',
+            ],
+        ),
+    ]
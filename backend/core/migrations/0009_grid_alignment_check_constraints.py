@@ -0,0 +1,43 @@
+# Generated by Django 4.2.18 on 2026-10-15 09:30
+
+from django.db import migrations
+
+# Tables and geometry columns that must sit on the 25mm base grid
+GRID_ALIGNED_COLUMNS = [
+    ('et_component', 'base_geometry'),
+    ('et_component_instance', 'spatial_data'),
+    ('et_connection', 'spatial_relationship'),
+]
+
+CREATE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION et_check_grid_25mm(geom geometry)
+RETURNS boolean AS $$
+    SELECT COALESCE(bool_and(
+        mod(ST_X(dp.geom)::numeric, 25) = 0 AND mod(ST_Y(dp.geom)::numeric, 25) = 0
+    ), true)
+    FROM ST_DumpPoints(
+        CASE WHEN GeometryType($1) = 'POLYGON' THEN ST_ExteriorRing($1) ELSE $1 END
+    ) AS dp
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_componentinstance_internal_id_sequence'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_FUNCTION_SQL,
+            reverse_sql='DROP FUNCTION IF EXISTS et_check_grid_25mm(geometry);',
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=f'ALTER TABLE {table} ADD CONSTRAINT {table}_grid_25mm '
+                f'CHECK (et_check_grid_25mm({column}));',
+            reverse_sql=f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_grid_25mm;',
+        )
+        for table, column in GRID_ALIGNED_COLUMNS
+    ]
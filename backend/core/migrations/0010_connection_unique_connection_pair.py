@@ -0,0 +1,17 @@
+# Generated by Django 4.2.18 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_grid_alignment_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='connection',
+            constraint=models.UniqueConstraint(fields=('instance_1', 'instance_2'), name='unique_connection_pair'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.18 on 2026-10-15 10:30
+
+import core.models.component
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_connection_unique_connection_pair'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='component',
+            name='classification',
+            field=models.CharField(help_text='Hierarchical classification following EuroTempl naming convention', max_length=50, validators=[core.models.component.validate_classification]),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.18 on 2026-10-15 11:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_alter_component_classification'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='componentinstance',
+            name='spatial_bbox',
+            field=django.contrib.gis.db.models.fields.PolygonField(editable=False, help_text='Spatial bounding box for quick filtering, derived on save', null=True, srid=4326),
+        ),
+        migrations.AlterField(
+            model_name='connection',
+            name='spatial_bbox',
+            field=django.contrib.gis.db.models.fields.PolygonField(editable=False, help_text='Spatial bounding box for quick filtering, derived on save', null=True, srid=4326),
+        ),
+    ]
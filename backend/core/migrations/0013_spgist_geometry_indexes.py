@@ -0,0 +1,89 @@
+# Generated by Django 4.2.18 on 2026-10-15 11:30
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+# (table, column, new SP-GiST index name)
+GEOMETRY_INDEXES = [
+    ('et_component', 'base_geometry', 'et_component_geom_spgist'),
+    ('et_component_instance', 'spatial_data', 'et_instance_geom_spgist'),
+    ('et_connection', 'spatial_relationship', 'et_connection_geom_spgist'),
+]
+
+
+def drop_gist_index_sql(table, column):
+    """Drop the GiST index Django created for spatial_index=True, whatever its name."""
+    return f"""
+DO $$
+DECLARE
+    idx text;
+BEGIN
+    FOR idx IN
+        SELECT indexname FROM pg_indexes
+        WHERE tablename = '{table}' AND indexdef LIKE '%USING gist ({column}%'
+    LOOP
+        EXECUTE format('DROP INDEX IF EXISTS %I', idx);
+    END LOOP;
+END $$;
+"""
+
+
+def create_gist_index_sql(table, column):
+    return (
+        f'CREATE INDEX IF NOT EXISTS {table}_{column}_id '
+        f'ON {table} USING GIST ({column} gist_geometry_ops_nd);'
+    )
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0012_alter_spatial_bbox_editable'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='component',
+                    name='base_geometry',
+                    field=django.contrib.gis.db.models.fields.GeometryField(dim=3, help_text='Base geometric definition using PostGIS', spatial_index=False, srid=4326),
+                ),
+                migrations.AlterField(
+                    model_name='componentinstance',
+                    name='spatial_data',
+                    field=django.contrib.gis.db.models.fields.GeometryField(dim=3, help_text='3D geometric representation with SFCGAL support', spatial_index=False, srid=4326),
+                ),
+                migrations.AlterField(
+                    model_name='connection',
+                    name='spatial_relationship',
+                    field=django.contrib.gis.db.models.fields.GeometryField(dim=3, help_text='3D geometric representation of connection', spatial_index=False, srid=4326),
+                ),
+            ],
+            database_operations=[
+                # Passed as lists so the DO block is not split on its semicolons
+                migrations.RunSQL(
+                    sql=[drop_gist_index_sql(table, column)],
+                    reverse_sql=[create_gist_index_sql(table, column)],
+                )
+                for table, column, _ in GEOMETRY_INDEXES
+            ],
+        ),
+        AddIndexConcurrently(
+            model_name='component',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['base_geometry'], name='et_component_geom_spgist'),
+        ),
+        AddIndexConcurrently(
+            model_name='componentinstance',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['spatial_data'], name='et_instance_geom_spgist'),
+        ),
+        AddIndexConcurrently(
+            model_name='connection',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['spatial_relationship'], name='et_connection_geom_spgist'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.18 on 2026-10-15 12:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0013_spgist_geometry_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='connection',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['spatial_bbox'], name='et_connection_bbox_spgist'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.18 on 2026-10-15 12:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_connection_bbox_spgist'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='component',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['functional_properties'], name='et_comp_fprops_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='component',
+            index=models.Index(django.db.models.fields.json.KeyTransform('acoustic_rating', 'functional_properties'), name='et_comp_acoustic_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='component',
+            index=models.Index(django.db.models.fields.json.KeyTransform('emi_shield_level', 'functional_properties'), name='et_comp_emi_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='componentinstance',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['instance_properties'], name='et_inst_iprops_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['connection_properties'], name='et_conn_cprops_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=models.Index(django.db.models.fields.json.KeyTransform('fastener_type', 'connection_properties'), name='et_conn_fastener_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=models.Index(django.db.models.fields.json.KeyTransform('torque_spec', 'connection_properties'), name='et_conn_torque_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.18 on 2026-10-15 13:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_jsonb_property_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='componentinstance',
+            name='et_componen_created_0c013d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='connection',
+            name='et_connecti_created_9b46ce_idx',
+        ),
+        migrations.AddIndex(
+            model_name='componentinstance',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='et_instance_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='et_connection_created_brin', pages_per_range=32),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.18 on 2026-10-15 13:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_brin_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE MATERIALIZED VIEW et_component_summary AS
+                SELECT
+                    c.id AS component_id,
+                    (SELECT COUNT(*) FROM et_parameter p WHERE p.component_id = c.id) AS param_count,
+                    (SELECT COUNT(*) FROM core_materialrequirement m WHERE m.component_id = c.id) AS mat_count,
+                    (SELECT COUNT(*) FROM core_documentation d WHERE d.component_id = c.id) AS doc_count
+                FROM et_component c;
+                """,
+                "CREATE UNIQUE INDEX et_component_summary_pk ON et_component_summary (component_id);",
+            ],
+            reverse_sql=["DROP MATERIALIZED VIEW IF EXISTS et_component_summary;"],
+        ),
+        migrations.CreateModel(
+            name='ComponentSummary',
+            fields=[
+                ('component', models.OneToOneField(db_constraint=False, help_text='Summarized component', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='summary', serialize=False, to='core.component')),
+                ('param_count', models.IntegerField(help_text='Number of parameters')),
+                ('mat_count', models.IntegerField(help_text='Number of material requirements')),
+                ('doc_count', models.IntegerField(help_text='Number of documentation entries')),
+            ],
+            options={
+                'db_table': 'et_component_summary',
+                'managed': False,
+            },
+        ),
+    ]
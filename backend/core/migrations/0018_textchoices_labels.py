@@ -0,0 +1,28 @@
+# Generated by Django 4.2.18 on 2026-10-15 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_component_summary_view'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='componentinstance',
+            name='status',
+            field=models.CharField(choices=[('planned', 'Planned'), ('in_progress', 'In progress'), ('complete', 'Complete'), ('obsolete', 'Obsolete')], default='planned', help_text='Current status in lifecycle', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='connection',
+            name='connection_type',
+            field=models.CharField(choices=[('bolted', 'Bolted'), ('slotted', 'Slotted'), ('welded', 'Welded'), ('screwed', 'Screwed'), ('adhesive', 'Adhesive')], help_text='Classification of connection type', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='connection',
+            name='status',
+            field=models.CharField(choices=[('planned', 'Planned'), ('in_progress', 'In progress'), ('complete', 'Complete'), ('obsolete', 'Obsolete')], default='planned', help_text='Current lifecycle status', max_length=20),
+        ),
+    ]
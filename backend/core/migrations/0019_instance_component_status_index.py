@@ -0,0 +1,21 @@
+# Generated by Django 4.2.18 on 2026-10-15 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_textchoices_labels'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='componentinstance',
+            name='et_componen_compone_eba965_idx',
+        ),
+        migrations.AddIndex(
+            model_name='componentinstance',
+            index=models.Index(fields=['component', 'status'], name='et_instance_comp_status_idx'),
+        ),
+    ]
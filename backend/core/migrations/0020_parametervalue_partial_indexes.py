@@ -0,0 +1,33 @@
+# Generated by Django 4.2.18 on 2026-10-15 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_instance_component_status_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='parametervalue',
+            name='et_paramete_instanc_c29af0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='parametervalue',
+            name='et_paramete_validat_cb98a4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='parametervalue',
+            name='et_paramete_recorde_dccf6f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='parametervalue',
+            index=models.Index(condition=models.Q(('validation_status__in', ['invalid', 'pending'])), fields=['validation_status'], name='pv_invalid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parametervalue',
+            index=models.Index(condition=models.Q(('validation_status', 'valid')), fields=['recorded_at'], name='pv_recent_idx'),
+        ),
+    ]
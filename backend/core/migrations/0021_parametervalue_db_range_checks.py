@@ -0,0 +1,76 @@
+# Generated by Django 4.2.18 on 2026-10-15 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_parametervalue_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='parametervalue',
+            constraint=models.CheckConstraint(check=models.Q(('value__has_key', 'value')), name='pv_has_value_key'),
+        ),
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE OR REPLACE FUNCTION et_check_parameter_value_range()
+                RETURNS trigger AS $$
+                DECLARE
+                    dtype text;
+                    ranges jsonb;
+                    v numeric;
+                    min_v numeric;
+                    max_v numeric;
+                    step_v numeric;
+                    steps numeric;
+                BEGIN
+                    SELECT data_type, valid_ranges INTO dtype, ranges
+                    FROM et_parameter WHERE id = NEW.parameter_id;
+
+                    IF dtype NOT IN ('float', 'integer')
+                       OR ranges IS NULL
+                       OR jsonb_typeof(NEW.value -> 'value') IS DISTINCT FROM 'number' THEN
+                        RETURN NEW;
+                    END IF;
+
+                    v := (NEW.value ->> 'value')::numeric;
+                    min_v := (ranges ->> 'min')::numeric;
+                    max_v := (ranges ->> 'max')::numeric;
+                    step_v := (ranges ->> 'step')::numeric;
+
+                    IF v < min_v OR v > max_v THEN
+                        RAISE EXCEPTION 'Value % outside [%, %] for parameter %',
+                            v, min_v, max_v, NEW.parameter_id
+                            USING ERRCODE = 'check_violation';
+                    END IF;
+
+                    IF step_v IS NOT NULL AND step_v <> 0 THEN
+                        -- Same 1e-10 tolerance as Parameter._is_valid_step
+                        steps := (v - COALESCE(min_v, 0)) / step_v;
+                        IF abs(round(steps) - steps) >= 1e-10 THEN
+                            RAISE EXCEPTION 'Value % not in steps of % for parameter %',
+                                v, step_v, NEW.parameter_id
+                                USING ERRCODE = 'check_violation';
+                        END IF;
+                    END IF;
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+                """,
+                """
+                CREATE TRIGGER et_parameter_value_range
+                BEFORE INSERT OR UPDATE OF value, parameter_id ON et_parameter_value
+                FOR EACH ROW EXECUTE FUNCTION et_check_parameter_value_range();
+                """,
+            ],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS et_parameter_value_range ON et_parameter_value;",
+                "DROP FUNCTION IF EXISTS et_check_parameter_value_range();",
+            ],
+        ),
+    ]
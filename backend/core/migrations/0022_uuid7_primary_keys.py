@@ -0,0 +1,24 @@
+# Generated by Django 4.2.18 on 2026-10-15 15:40
+
+import core.utils.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_parametervalue_db_range_checks'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='parameter',
+            name='id',
+            field=models.UUIDField(default=core.utils.uuid7.uuid7, editable=False, help_text='Unique identifier for the parameter', primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='parametervalue',
+            name='id',
+            field=models.UUIDField(default=core.utils.uuid7.uuid7, editable=False, help_text='Unique identifier for the parameter value', primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,140 @@
+# Generated by Django 4.2.18 on 2026-10-15 16:10
+
+from django.db import migrations, models
+
+
+# Previous body from 0021, restored when this migration is reversed
+JSON_RANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION et_check_parameter_value_range()
+RETURNS trigger AS $$
+DECLARE
+    dtype text;
+    ranges jsonb;
+    v numeric;
+    min_v numeric;
+    max_v numeric;
+    step_v numeric;
+    steps numeric;
+BEGIN
+    SELECT data_type, valid_ranges INTO dtype, ranges
+    FROM et_parameter WHERE id = NEW.parameter_id;
+
+    IF dtype NOT IN ('float', 'integer')
+       OR ranges IS NULL
+       OR jsonb_typeof(NEW.value -> 'value') IS DISTINCT FROM 'number' THEN
+        RETURN NEW;
+    END IF;
+
+    v := (NEW.value ->> 'value')::numeric;
+    min_v := (ranges ->> 'min')::numeric;
+    max_v := (ranges ->> 'max')::numeric;
+    step_v := (ranges ->> 'step')::numeric;
+
+    IF v < min_v OR v > max_v THEN
+        RAISE EXCEPTION 'Value % outside [%, %] for parameter %',
+            v, min_v, max_v, NEW.parameter_id
+            USING ERRCODE = 'check_violation';
+    END IF;
+
+    IF step_v IS NOT NULL AND step_v <> 0 THEN
+        -- Same 1e-10 tolerance as Parameter._is_valid_step
+        steps := (v - COALESCE(min_v, 0)) / step_v;
+        IF abs(round(steps) - steps) >= 1e-10 THEN
+            RAISE EXCEPTION 'Value % not in steps of % for parameter %',
+                v, step_v, NEW.parameter_id
+                USING ERRCODE = 'check_violation';
+        END IF;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+COLUMN_RANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION et_check_parameter_value_range()
+RETURNS trigger AS $$
+DECLARE
+    dtype text;
+    v numeric;
+    min_v numeric;
+    max_v numeric;
+    step_v numeric;
+    steps numeric;
+BEGIN
+    SELECT data_type, min_value::numeric, max_value::numeric, step_value::numeric
+    INTO dtype, min_v, max_v, step_v
+    FROM et_parameter WHERE id = NEW.parameter_id;
+
+    IF dtype NOT IN ('float', 'integer')
+       OR jsonb_typeof(NEW.value -> 'value') IS DISTINCT FROM 'number' THEN
+        RETURN NEW;
+    END IF;
+
+    v := (NEW.value ->> 'value')::numeric;
+
+    IF v < min_v OR v > max_v THEN
+        RAISE EXCEPTION 'Value % outside [%, %] for parameter %',
+            v, min_v, max_v, NEW.parameter_id
+            USING ERRCODE = 'check_violation';
+    END IF;
+
+    IF step_v IS NOT NULL AND step_v <> 0 THEN
+        -- Same 1e-10 tolerance as Parameter._is_valid_step
+        steps := (v - COALESCE(min_v, 0)) / step_v;
+        IF abs(round(steps) - steps) >= 1e-10 THEN
+            RAISE EXCEPTION 'Value % not in steps of % for parameter %',
+                v, step_v, NEW.parameter_id
+                USING ERRCODE = 'check_violation';
+        END IF;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='parameter',
+            name='min_value',
+            field=models.FloatField(blank=True, editable=False, help_text='Minimum allowed value for numeric parameters', null=True),
+        ),
+        migrations.AddField(
+            model_name='parameter',
+            name='max_value',
+            field=models.FloatField(blank=True, editable=False, help_text='Maximum allowed value for numeric parameters', null=True),
+        ),
+        migrations.AddField(
+            model_name='parameter',
+            name='step_value',
+            field=models.FloatField(blank=True, editable=False, help_text='Step size from the minimum for numeric parameters', null=True),
+        ),
+        migrations.RunSQL(
+            sql=[
+                """
+                UPDATE et_parameter SET
+                    min_value = CASE WHEN jsonb_typeof(valid_ranges -> 'min') = 'number'
+                                     THEN (valid_ranges ->> 'min')::double precision END,
+                    max_value = CASE WHEN jsonb_typeof(valid_ranges -> 'max') = 'number'
+                                     THEN (valid_ranges ->> 'max')::double precision END,
+                    step_value = CASE WHEN jsonb_typeof(valid_ranges -> 'step') = 'number'
+                                      THEN (valid_ranges ->> 'step')::double precision END
+                WHERE data_type IN ('float', 'integer')
+                  AND jsonb_typeof(valid_ranges) = 'object';
+                """,
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=[COLUMN_RANGE_FUNCTION],
+            reverse_sql=[JSON_RANGE_FUNCTION],
+        ),
+    ]
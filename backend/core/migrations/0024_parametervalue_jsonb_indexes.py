@@ -0,0 +1,23 @@
+# Generated by Django 4.2.18 on 2026-10-15 16:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_parameter_range_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='parametervalue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['value'], name='pv_value_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='parametervalue',
+            index=models.Index(django.db.models.fields.json.KeyTransform('value', 'value'), name='pv_value_idx'),
+        ),
+    ]
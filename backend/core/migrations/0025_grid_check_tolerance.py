@@ -0,0 +1,47 @@
+# Generated by Django 4.2.18 on 2026-10-15 18:40
+
+from django.db import migrations
+
+
+# Previous body from 0009, restored when this migration is reversed
+EXACT_GRID_FUNCTION = """
+CREATE OR REPLACE FUNCTION et_check_grid_25mm(geom geometry)
+RETURNS boolean AS $$
+    SELECT COALESCE(bool_and(
+        mod(ST_X(dp.geom)::numeric, 25) = 0 AND mod(ST_Y(dp.geom)::numeric, 25) = 0
+    ), true)
+    FROM ST_DumpPoints(
+        CASE WHEN GeometryType($1) = 'POLYGON' THEN ST_ExteriorRing($1) ELSE $1 END
+    ) AS dp
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+"""
+
+# Accept coordinates within 1e-9 of a grid line, as core.models._grid does.
+# mod() keeps the sign of the dividend, hence abs() before taking the
+# distance to the nearer grid line.
+TOLERANT_GRID_FUNCTION = """
+CREATE OR REPLACE FUNCTION et_check_grid_25mm(geom geometry)
+RETURNS boolean AS $$
+    SELECT COALESCE(bool_and(
+        LEAST(abs(mod(ST_X(dp.geom)::numeric, 25)), 25 - abs(mod(ST_X(dp.geom)::numeric, 25))) <= 1e-9
+        AND LEAST(abs(mod(ST_Y(dp.geom)::numeric, 25)), 25 - abs(mod(ST_Y(dp.geom)::numeric, 25))) <= 1e-9
+    ), true)
+    FROM ST_DumpPoints(
+        CASE WHEN GeometryType($1) = 'POLYGON' THEN ST_ExteriorRing($1) ELSE $1 END
+    ) AS dp
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_parametervalue_jsonb_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[TOLERANT_GRID_FUNCTION],
+            reverse_sql=[EXACT_GRID_FUNCTION],
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.18 on 2026-10-15 19:20
+
+from django.db import migrations
+
+
+# Derive min_value/max_value/step_value from valid_ranges on every write, so
+# QuerySet.update(), bulk_create() and raw SQL cannot leave stale limits for
+# et_check_parameter_value_range to enforce. Mirrors Parameter._sync_range_columns.
+SYNC_FUNCTION = """
+CREATE OR REPLACE FUNCTION et_sync_parameter_range_columns()
+RETURNS trigger AS $$
+BEGIN
+    IF NEW.data_type IN ('float', 'integer') AND jsonb_typeof(NEW.valid_ranges) = 'object' THEN
+        NEW.min_value := CASE WHEN jsonb_typeof(NEW.valid_ranges -> 'min') = 'number'
+                              THEN (NEW.valid_ranges ->> 'min')::double precision END;
+        NEW.max_value := CASE WHEN jsonb_typeof(NEW.valid_ranges -> 'max') = 'number'
+                              THEN (NEW.valid_ranges ->> 'max')::double precision END;
+        NEW.step_value := CASE WHEN jsonb_typeof(NEW.valid_ranges -> 'step') = 'number'
+                               THEN (NEW.valid_ranges ->> 'step')::double precision END;
+    ELSE
+        NEW.min_value := NULL;
+        NEW.max_value := NULL;
+        NEW.step_value := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_grid_check_tolerance'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                SYNC_FUNCTION,
+                """
+                CREATE TRIGGER et_parameter_sync_range_columns
+                BEFORE INSERT OR UPDATE ON et_parameter
+                FOR EACH ROW EXECUTE FUNCTION et_sync_parameter_range_columns();
+                """,
+                # Re-derive rows written since 0023 outside clean()
+                "UPDATE et_parameter SET valid_ranges = valid_ranges;",
+            ],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS et_parameter_sync_range_columns ON et_parameter;",
+                "DROP FUNCTION IF EXISTS et_sync_parameter_range_columns();",
+            ],
+        ),
+    ]
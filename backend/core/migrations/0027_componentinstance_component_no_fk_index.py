@@ -0,0 +1,19 @@
+# Generated by Django 4.2.18 on 2026-10-15 20:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_parameter_range_columns_trigger'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='componentinstance',
+            name='component',
+            field=models.ForeignKey(db_index=False, help_text='Reference to parent Component', on_delete=django.db.models.deletion.RESTRICT, to='core.component'),
+        ),
+    ]
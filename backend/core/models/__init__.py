@@ -5,6 +5,7 @@ from .documentation import Documentation
 from .instance import ComponentInstance, ComponentStatus
 from .value import ParameterValue
 from .connection import Connection, ConnectionType, ConnectionStatus
+from .summary import ComponentSummary
 
 __all__ = [
     'Component',
@@ -17,4 +18,5 @@ __all__ = [
     'Connection',
     'ConnectionType',
     'ConnectionStatus',
+    'ComponentSummary',
 ]
\ No newline at end of file
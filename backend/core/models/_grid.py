@@ -0,0 +1,119 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Helpers for validating geometry against the EuroTempl 25mm base grid.
+"""
+
+import struct
+
+import numpy as np
+from django.contrib.gis.geos import Polygon
+
+GRID_SIZE = 25.0
+
+# Absolute slack (mm) for coordinates that drifted off the grid through
+# floating-point arithmetic; matches et_check_grid_25mm (migration 0025)
+GRID_TOLERANCE = 1e-9
+
+# WKB polygon layout: byte order (1) + type (4) + ring count (4) + point count (4)
+_WKB_RING_OFFSET = 13
+_WKB_POLYGON = 3
+_EWKB_Z_FLAG = 0x80000000
+
+
+def _exterior_ring_array(geom):
+    """
+    Return the exterior ring of a polygon as an (n, dims) float64 array.
+
+    The array is a read-only view over the geometry's WKB buffer, so no
+    per-vertex Python floats are created. Returns None for anything that is
+    not a single polygon.
+    """
+    wkb = geom.wkb
+    endian = '<' if wkb[0] == 1 else '>'
+    geom_type, n_rings = struct.unpack_from(f'{endian}II', wkb, 1)
+    has_z = bool(geom_type & _EWKB_Z_FLAG) or (geom_type & 0xFFFF) // 1000 in (1, 3)
+    if (geom_type & 0xFFFF) % 1000 != _WKB_POLYGON:
+        return None
+    if n_rings == 0:
+        return np.empty((0, 2))
+    (n_points,) = struct.unpack_from(f'{endian}I', wkb, 9)
+    dims = 3 if has_z else 2
+    arr = np.frombuffer(
+        wkb, dtype=np.dtype(f'{endian}f8'), count=n_points * dims, offset=_WKB_RING_OFFSET
+    )
+    return arr.reshape(n_points, dims)
+
+
+def _flatten_coords(coords, out):
+    """Append every ordinate of a nested GEOS coords tuple to out."""
+    if coords and not isinstance(coords[0], tuple):
+        out.extend(coords)
+        return
+    for part in coords:
+        _flatten_coords(part, out)
+
+
+def _all_vertices_array(geom):
+    """
+    Return every vertex of the geometry as an (n, dims) float64 array,
+    recursing into sub-geometries and all of their rings, like
+    ST_DumpPoints does for et_check_grid_25mm.
+    """
+    flat = []
+    _flatten_coords(geom.coords, flat)
+    dims = 3 if geom.hasz else 2
+    return np.asarray(flat, dtype=np.float64).reshape(-1, dims)
+
+
+def is_grid_aligned(geom) -> bool:
+    """
+    Check that every x,y coordinate of the geometry lies on the 25mm base grid,
+    to within GRID_TOLERANCE.
+
+    For polygons only the exterior ring is checked; for every other geometry
+    all vertices are checked, matching the et_check_grid_25mm constraint.
+
+    Args:
+        geom: GEOSGeometry to check
+
+    Returns:
+        bool: True if all coordinates are grid aligned
+    """
+    arr = _exterior_ring_array(geom)
+    if arr is None:
+        arr = _all_vertices_array(geom)
+    if arr.size == 0:
+        return True
+    # Only x,y alignment is enforced; z is free. A remainder just below
+    # GRID_SIZE is as aligned as one just above zero.
+    rem = np.mod(arr[:, :2], GRID_SIZE)
+    return bool(np.all(np.minimum(rem, GRID_SIZE - rem) <= GRID_TOLERANCE))
+
+
+def bounding_polygon(geom):
+    """
+    Return the 2D bounding box of a geometry as a Polygon, for the
+    PolygonField spatial_bbox columns.
+
+    GEOS returns a Point or LineString envelope when the extent is flat in x
+    or y (points, axis-parallel lines); such axes are padded by one grid step
+    on each side so the result is always a Polygon containing the geometry.
+
+    Args:
+        geom: GEOSGeometry to bound
+
+    Returns:
+        Polygon: Bounding box in the geometry's SRID
+    """
+    envelope = geom.envelope
+    if envelope.geom_type == 'Polygon':
+        return envelope
+    xmin, ymin, xmax, ymax = geom.extent
+    if xmin == xmax:
+        xmin, xmax = xmin - GRID_SIZE, xmax + GRID_SIZE
+    if ymin == ymax:
+        ymin, ymax = ymin - GRID_SIZE, ymax + GRID_SIZE
+    bbox = Polygon.from_bbox((xmin, ymin, xmax, ymax))
+    bbox.srid = geom.srid
+    return bbox
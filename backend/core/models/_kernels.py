@@ -0,0 +1,27 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Numeric kernels for validating batches of parameter values.
+"""
+
+import numpy as np
+
+# Tolerance for floating point drift in step checks
+STEP_TOLERANCE = 1e-10
+
+
+def valid_steps(values, step, min_val=0.0, tol=STEP_TOLERANCE) -> np.ndarray:
+    """
+    Check which values lie on the step grid starting at min_val.
+
+    Args:
+        values: Sequence or array of numbers
+        step: Step size
+        min_val: Origin of the step grid
+        tol: Allowed floating point drift, in steps
+
+    Returns:
+        np.ndarray: Boolean mask, True where the value follows the step
+    """
+    s = (np.asarray(values, dtype=np.float64) - min_val) / step
+    return np.abs(np.rint(s) - s) < tol
@@ -1,10 +1,35 @@
-from django.db import models
-from django.db.models import JSONField
+from django.db import models, transaction, IntegrityError
+from django.db.models import JSONField, Prefetch
+from django.db.models.fields.json import KeyTransform
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator
+import re
 import uuid
-import semver
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex, SpGistIndex
+
+from ._grid import is_grid_aligned
+
+# Patterns are used with fullmatch(), so a trailing newline cannot slip past '$'
+_CLASSIFICATION_RE = re.compile(r'ET_[A-Z]{3}_[A-Z]{4}_[A-Z]{3}_\d{3}(?:_[rv]\d+)?')
+# Functional properties every component must declare
+_COMPONENT_REQUIRED = frozenset({'acoustic_rating', 'emi_shield_level'})
+
+_SEMVER_RE = re.compile(r"""
+    v?
+    (?:0|[1-9]\d*) \. (?:0|[1-9]\d*) \. (?:0|[1-9]\d*)   # major.minor.patch
+    (?:-[0-9A-Za-z.-]+)?                                # pre-release
+    (?:\+[0-9A-Za-z.-]+)?                               # build metadata
+""", re.VERBOSE)
+
+
+def validate_classification(value):
+    """Validate that a classification follows the EuroTempl naming convention."""
+    if _CLASSIFICATION_RE.fullmatch(value) is None:
+        raise ValidationError(
+            "Classification must follow EuroTempl format: ET_XXX_XXXX_XXX_000",
+            code='invalid'
+        )
+
 
 class Component(gis_models.Model):
     """
@@ -23,12 +48,7 @@ class Component(gis_models.Model):
 
     classification = models.CharField(
         max_length=50,
-        validators=[
-            RegexValidator(
-                regex=r'^ET_[A-Z]{3}_[A-Z]{4}_[A-Z]{3}_\d{3}(_[rv]\d+)?$',
-                message="Classification must follow EuroTempl format: ET_XXX_XXXX_XXX_000"
-            )
-        ],
+        validators=[validate_classification],
         help_text="Hierarchical classification following EuroTempl naming convention"
     )
 
@@ -51,7 +71,7 @@ class Component(gis_models.Model):
     # Spatial data field for geometric representation
     base_geometry = gis_models.GeometryField(
         dim=3,
-        spatial_index=True,
+        spatial_index=False,  # SP-GiST index declared in Meta.indexes
         help_text="Base geometric definition using PostGIS"
     )
 
@@ -75,6 +95,10 @@ class Component(gis_models.Model):
             models.Index(fields=['classification']),
             models.Index(fields=['name']),
             models.Index(fields=['is_active']),
+            SpGistIndex(fields=['base_geometry'], name='et_component_geom_spgist'),
+            GinIndex(fields=['functional_properties'], opclasses=['jsonb_path_ops'], name='et_comp_fprops_gin'),
+            models.Index(KeyTransform('acoustic_rating', 'functional_properties'), name='et_comp_acoustic_idx'),
+            models.Index(KeyTransform('emi_shield_level', 'functional_properties'), name='et_comp_emi_idx'),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -88,16 +112,13 @@ class Component(gis_models.Model):
         Validate the component according to EuroTempl business rules.
         """
         # Validate version follows semantic versioning
-        try:
-            semver.VersionInfo.parse(self.version.lstrip('v'))
-        except ValueError:
+        if _SEMVER_RE.fullmatch(self.version) is None:
             raise ValidationError({
                 'version': 'Version must follow semantic versioning (MAJOR.MINOR.PATCH)'
             })
     
         # Validate functional properties contain required characteristics
-        required_properties = {'acoustic_rating', 'emi_shield_level'}
-        if not all(prop in self.functional_properties for prop in required_properties):
+        if not _COMPONENT_REQUIRED.issubset(self.functional_properties):
             raise ValidationError({
                 'functional_properties': 'Must include acoustic_rating and emi_shield_level'
             })
@@ -117,20 +138,25 @@ class Component(gis_models.Model):
         if not self.base_geometry:
             return
             
-        coords = self.base_geometry.coords
-        for coord in coords[0]:  # Check first ring coordinates
-            x, y, z = coord
-            if any(c % 25 != 0 for c in (x, y)):  # Only check x,y alignment !
-                raise ValidationError({
-                    'base_geometry': 'Geometry must align with 25mm grid system'
-                })
+        if not is_grid_aligned(self.base_geometry):
+            raise ValidationError({
+                'base_geometry': 'Geometry must align with 25mm grid system'
+            })
 
     def save(self, *args, **kwargs):
         """
         Override save to ensure validation is always performed.
+
+        Uniqueness is enforced by the database constraints instead of a
+        SELECT per constraint; violations are re-raised as ValidationError.
         """
-        self.full_clean()
-        super().save(*args, **kwargs)
+        self.clean_fields(exclude=['id', 'created_at', 'modified_at'])
+        self.clean()
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            raise ValidationError(f"Component rejected by database: {e}") from e
 
     def __str__(self):
         return f"{self.classification} - {self.name} (v{self.version})"
@@ -140,25 +166,61 @@ class Component(gis_models.Model):
         """Create a new ComponentInstance from this component definition."""
         from .instance import ComponentInstance, ComponentStatus  # Avoid circular import
         
-        # Get next internal_id
-        last_internal_id = ComponentInstance.objects.all().order_by('-internal_id').first()
-        next_internal_id = (last_internal_id.internal_id + 1) if last_internal_id else 1
-        
-        # Create instance with all required fields
+        # Create instance with all required fields; internal_id comes from the DB sequence
         instance = ComponentInstance.objects.create(
             component=self,
             spatial_data=self.base_geometry,
-            spatial_bbox=self.base_geometry.envelope,
             instance_properties={"finish": "matte"},
             status=ComponentStatus.PLANNED.value,
-            version=1,
-            internal_id=next_internal_id
+            version=1
         )
         return instance
 
+    def bulk_instantiate(self, specs, batch_size=1000):
+        """
+        Create many ComponentInstances of this component in a single round-trip.
+        See ComponentInstance.bulk_instantiate for the format of specs.
+        """
+        from .instance import ComponentInstance  # Avoid circular import
+
+        return ComponentInstance.bulk_instantiate(self, specs, batch_size=batch_size)
+
+    @classmethod
+    def with_related(cls):
+        """
+        Return a queryset that prefetches all related collections, so list views
+        calling the get_* accessors on many components run a fixed number of queries.
+        """
+        return cls.objects.prefetch_related(
+            'parameter_set',
+            'materialrequirement_set',
+            'documentation_set',
+            'componentinstance_set'
+        )
+
+    @classmethod
+    def with_parameter_values(cls):
+        """
+        Return a queryset that prefetches parameters and their values (with the
+        owning instance joined), so Parameter.get_values() on any loaded
+        parameter is served from memory. Loading N components costs three
+        queries in total instead of one per parameter.
+        """
+        from .value import ParameterValue  # Avoid circular import
+
+        return cls.objects.prefetch_related(
+            Prefetch(
+                'parameter_set__parametervalue_set',
+                queryset=ParameterValue.objects.select_related('instance')
+            )
+        )
+
     def get_parameters(self):
         """
         Retrieve all parameters associated with this component.
+
+        The reverse manager already attaches this component to each row, and
+        .all() reuses results prefetched through with_related().
         """
         return self.parameter_set.all()
 
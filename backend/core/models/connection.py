@@ -6,39 +6,76 @@ This model manages the relationships and physical connections between component
 instances, implementing a parametric approach to defining connections while 
 ensuring compliance with engineering standards.
 """
-from django.db.models import Q
-
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.db.models import JSONField
+from django.db.models.functions import Now
+from django.db.models.fields.json import KeyTransform
 from django.core.exceptions import ValidationError
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, SpGistIndex
 from django.core.validators import MinValueValidator
 import uuid
-from enum import Enum
 
-class ConnectionStatus(str, Enum):
-    """Enumeration of possible connection statuses."""
-    PLANNED = 'planned'
-    IN_PROGRESS = 'in_progress'
-    COMPLETE = 'complete'
-    OBSOLETE = 'obsolete'
+from ._grid import bounding_polygon, is_grid_aligned
 
-    @classmethod
-    def choices(cls):
-        return [(status.value, status.name) for status in cls]
+class ConnectionStatus(models.TextChoices):
+    """Enumeration of possible connection statuses."""
+    PLANNED = 'planned', 'Planned'
+    IN_PROGRESS = 'in_progress', 'In progress'
+    COMPLETE = 'complete', 'Complete'
+    OBSOLETE = 'obsolete', 'Obsolete'
 
-class ConnectionType(str, Enum):
+class ConnectionType(models.TextChoices):
     """Enumeration of standard connection types."""
-    BOLTED = 'bolted'
-    SLOTTED = 'slotted'
-    WELDED = 'welded'
-    SCREWED = 'screwed'
-    ADHESIVE = 'adhesive'
+    BOLTED = 'bolted', 'Bolted'
+    SLOTTED = 'slotted', 'Slotted'
+    WELDED = 'welded', 'Welded'
+    SCREWED = 'screwed', 'Screwed'
+    ADHESIVE = 'adhesive', 'Adhesive'
+
+# TextChoices.values builds a new list on each access; keep a set for membership tests
+_VALID_STATUSES = frozenset(ConnectionStatus.values)
+
+# Properties each connection type must specify
+_CONN_REQUIRED = {
+    ConnectionType.BOLTED.value: frozenset({'fastener_type', 'torque_spec'}),
+    ConnectionType.SLOTTED.value: frozenset({'slot_size', 'insertion_depth'}),
+    ConnectionType.WELDED.value: frozenset({'weld_type', 'weld_length'}),
+}
+
+class ConnectionQuerySet(models.QuerySet):
+    """Spatial query helpers for connections."""
+
+    def bbox_overlapping(self, geom):
+        """
+        Return connections whose bounding box overlaps that of geom.
+        Compiles to the && operator, answered from the spatial_bbox index alone.
+        """
+        return self.filter(spatial_bbox__bboverlaps=geom)
+
+    def overlapping(self, geom):
+        """
+        Return connections whose geometry intersects geom. The && test on
+        spatial_bbox prefilters candidates through the index before the
+        exact ST_Intersects check runs.
+        """
+        return self.bbox_overlapping(geom).filter(spatial_relationship__intersects=geom)
 
-    @classmethod
-    def choices(cls):
-        return [(type.value, type.name) for type in cls]
+    def bulk_update_status(self, new_status):
+        """
+        Move every connection in the queryset to new_status with a single UPDATE.
+        Bypasses save(); timestamps are taken from the database clock.
+
+        Args:
+            new_status (str): New status value from ConnectionStatus enum
+
+        Returns:
+            int: Number of connections updated
+        """
+        if new_status not in _VALID_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}")
+        return self.update(status=new_status, status_changed_at=Now(), modified_at=Now())
 
 class Connection(gis_models.Model):
     """
@@ -73,7 +110,7 @@ class Connection(gis_models.Model):
     # Connection specifications
     connection_type = models.CharField(
         max_length=50,
-        choices=ConnectionType.choices(),
+        choices=ConnectionType.choices,
         help_text="Classification of connection type"
     )
 
@@ -85,13 +122,14 @@ class Connection(gis_models.Model):
     # Spatial data
     spatial_relationship = gis_models.GeometryField(
         dim=3,
-        spatial_index=True,
+        spatial_index=False,  # SP-GiST index declared in Meta.indexes
         help_text="3D geometric representation of connection"
     )
 
     spatial_bbox = gis_models.PolygonField(
         null=True,
-        help_text="Spatial bounding box for quick filtering"
+        editable=False,
+        help_text="Spatial bounding box for quick filtering, derived on save"
     )
 
     # Structural properties
@@ -103,7 +141,7 @@ class Connection(gis_models.Model):
     # Status and hierarchy
     status = models.CharField(
         max_length=20,
-        choices=ConnectionStatus.choices(),
+        choices=ConnectionStatus.choices,
         default=ConnectionStatus.PLANNED.value,
         help_text="Current lifecycle status"
     )
@@ -132,36 +170,47 @@ class Connection(gis_models.Model):
         help_text="When status was last changed"
     )
 
+    objects = ConnectionQuerySet.as_manager()
+
     class Meta:
         db_table = 'et_connection'
         indexes = [
             models.Index(fields=['connection_type']),
             models.Index(fields=['status']),
             models.Index(fields=['is_structural']),
-            models.Index(fields=['created_at']),
+            BrinIndex(fields=['created_at'], pages_per_range=32, name='et_connection_created_brin'),
+            SpGistIndex(fields=['spatial_relationship'], name='et_connection_geom_spgist'),
+            SpGistIndex(fields=['spatial_bbox'], name='et_connection_bbox_spgist'),
+            GinIndex(fields=['connection_properties'], opclasses=['jsonb_path_ops'], name='et_conn_cprops_gin'),
+            models.Index(KeyTransform('fastener_type', 'connection_properties'), name='et_conn_fastener_idx'),
+            models.Index(KeyTransform('torque_spec', 'connection_properties'), name='et_conn_torque_idx'),
         ]
         constraints = [
             models.CheckConstraint(
                 check=models.Q(instance_1_id__lt=models.F('instance_2_id')),
                 name='prevent_duplicate_connections'
+            ),
+            models.UniqueConstraint(
+                fields=['instance_1', 'instance_2'],
+                name='unique_connection_pair'
             )
         ]
 
     def clean(self):
         """Validate the connection according to EuroTempl business rules."""
-        if self.instance_1 and self.instance_2:
+        if self.instance_1_id and self.instance_2_id:
             # Ensure instances are different
-            if self.instance_1 == self.instance_2:
+            if self.instance_1_id == self.instance_2_id:
                 raise ValidationError("Cannot create a connection between the same instance")
             
-            # Check for existing connections in either direction
+            # Pairs are stored in canonical order (see save), so one lookup covers both directions
+            first_id, second_id = sorted((self.instance_1_id, self.instance_2_id))
             existing = Connection.objects.filter(
-                (Q(instance_1=self.instance_1) & Q(instance_2=self.instance_2)) |
-                (Q(instance_1=self.instance_2) & Q(instance_2=self.instance_1))
+                instance_1_id=first_id,
+                instance_2_id=second_id
             ).exclude(pk=self.pk)
-        
-        if existing.exists():
-            raise ValidationError("A connection between these instances already exists")
+            if existing.exists():
+                raise ValidationError("A connection between these instances already exists")
         self._validate_spatial_integrity()
         self._validate_grid_alignment()
         self._validate_property_schema()
@@ -181,13 +230,10 @@ class Connection(gis_models.Model):
         if not self.spatial_relationship:
             return
 
-        coords = self.spatial_relationship.coords
-        for coord in coords[0]:
-            x, y, z = coord
-            if any(c % 25 != 0 for c in (x, y)):
-                raise ValidationError({
-                    'spatial_relationship': 'Connection points must align with 25mm grid system'
-                })
+        if not is_grid_aligned(self.spatial_relationship):
+            raise ValidationError({
+                'spatial_relationship': 'Connection points must align with 25mm grid system'
+            })
 
     def _validate_property_schema(self):
         """Validate connection properties conform to type-specific schemas."""
@@ -196,18 +242,12 @@ class Connection(gis_models.Model):
                 'connection_properties': 'Properties must be a dictionary'
             })
 
-        required_properties = {
-            ConnectionType.BOLTED.value: {'fastener_type', 'torque_spec'},
-            ConnectionType.SLOTTED.value: {'slot_size', 'insertion_depth'},
-            ConnectionType.WELDED.value: {'weld_type', 'weld_length'},
-        }
-
-        if self.connection_type in required_properties:
-            missing = required_properties[self.connection_type] - self.connection_properties.keys()
-            if missing:
-                raise ValidationError({
-                    'connection_properties': f'Missing required properties: {missing}'
-                })
+        required = _CONN_REQUIRED.get(self.connection_type)
+        if required and not required.issubset(self.connection_properties):
+            missing = required - self.connection_properties.keys()
+            raise ValidationError({
+                'connection_properties': f'Missing required properties: {set(missing)}'
+            })
 
     def _validate_emi_continuity(self):
         """Validate EMI shielding continuity requirements."""
@@ -235,8 +275,7 @@ class Connection(gis_models.Model):
         Args:
             new_status (str): New status value from ConnectionStatus enum
         """
-        valid_statuses = [status.value for status in ConnectionStatus]
-        if new_status not in valid_statuses:
+        if new_status not in _VALID_STATUSES:
             raise ValueError(f"Invalid status: {new_status}")
         
         self.status = new_status
@@ -244,20 +283,28 @@ class Connection(gis_models.Model):
         self.save()
 
     def calculate_bounding_box(self):
-        """Calculate and update the spatial bounding box."""
+        """
+        Derive the spatial bounding box from the geometry. Computed in-process
+        so that save() writes it with the same INSERT/UPDATE; always a Polygon,
+        even for points and axis-parallel lines.
+        """
         if self.spatial_relationship:
-            self.spatial_bbox = self.spatial_relationship.envelope3d
-            self.save(update_fields=['spatial_bbox'])
+            self.spatial_bbox = bounding_polygon(self.spatial_relationship)
+        return self.spatial_bbox
 
     def save(self, *args, **kwargs):
         """Override save to ensure validation and bounding box calculation."""
         # Ensure consistent ordering of instances
-        if self.instance_1_id > self.instance_2_id:
+        if self.instance_1_id and self.instance_2_id and self.instance_1_id > self.instance_2_id:
             self.instance_1_id, self.instance_2_id = self.instance_2_id, self.instance_1_id
-        self.full_clean()
-        if not self.spatial_bbox and self.spatial_relationship:
-            self.calculate_bounding_box()
-        super().save(*args, **kwargs)
+        self.clean_fields(exclude=['id', 'created_at', 'modified_at', 'status_changed_at'])
+        self.clean()
+        self.calculate_bounding_box()
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            raise ValidationError(f"Connection rejected by database: {e}") from e
 
     def __str__(self):
         """String representation of the connection."""
@@ -4,24 +4,62 @@ Copyright (c) 2024 Pygmalion Records
 ComponentInstance model implementation for the EuroTempl system.
 """
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.db.models import JSONField
+from django.db.models.functions import Now
 from django.core.exceptions import ValidationError
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, SpGistIndex
 from django.core.validators import MinValueValidator
 import uuid
-from enum import Enum
 
-class ComponentStatus(str, Enum):
+from ._grid import bounding_polygon, is_grid_aligned
+
+# Server-side sequence backing ComponentInstance.internal_id (see migration 0008)
+INTERNAL_ID_SEQUENCE = 'et_component_instance_internal_id_seq'
+
+class NextVal(models.Func):
+    """Draw the next value of a PostgreSQL sequence as part of the INSERT itself."""
+    function = 'nextval'
+    output_field = models.IntegerField()
+
+    def __init__(self, sequence_name, **extra):
+        super().__init__(models.Value(sequence_name), **extra)
+
+class InternalIdField(models.IntegerField):
+    """
+    Integer column populated from a database sequence. The value is returned
+    by the INSERT (RETURNING clause), so no follow-up query is needed.
+    """
+    db_returning = True
+
+class ComponentStatus(models.TextChoices):
     """Enumeration of possible component instance statuses."""
-    PLANNED = 'planned'
-    IN_PROGRESS = 'in_progress'
-    COMPLETE = 'complete'
-    OBSOLETE = 'obsolete'
+    PLANNED = 'planned', 'Planned'
+    IN_PROGRESS = 'in_progress', 'In progress'
+    COMPLETE = 'complete', 'Complete'
+    OBSOLETE = 'obsolete', 'Obsolete'
 
-    @classmethod
-    def choices(cls):
-        return [(status.value, status.name) for status in cls]
+# TextChoices.values builds a new list on each access; keep a set for membership tests
+_VALID_STATUSES = frozenset(ComponentStatus.values)
+
+class ComponentInstanceQuerySet(models.QuerySet):
+    """Batch operations on component instances."""
+
+    def bulk_update_status(self, new_status):
+        """
+        Move every instance in the queryset to new_status with a single UPDATE.
+        Bypasses save(); timestamps are taken from the database clock.
+
+        Args:
+            new_status (str): New status value from ComponentStatus enum
+
+        Returns:
+            int: Number of instances updated
+        """
+        if new_status not in _VALID_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}")
+        return self.update(status=new_status, status_changed_at=Now(), modified_at=Now())
 
 class ComponentInstance(gis_models.Model):
     """
@@ -38,28 +76,32 @@ class ComponentInstance(gis_models.Model):
         help_text="Primary identifier for the instance"
     )
 
-    internal_id = models.IntegerField(
+    internal_id = InternalIdField(
         unique=True,
         db_index=True,
+        blank=True,
+        editable=False,
         help_text="Internal sequential identifier for performance optimization"
     )
 
     component = models.ForeignKey(
         'Component',
         on_delete=models.RESTRICT,
+        db_index=False,  # covered by et_instance_comp_status_idx (component leads)
         help_text="Reference to parent Component"
     )
 
     # Spatial and geometric data
     spatial_data = gis_models.GeometryField(
         dim=3,
-        spatial_index=True,
+        spatial_index=False,  # SP-GiST index declared in Meta.indexes
         help_text="3D geometric representation with SFCGAL support"
     )
 
     spatial_bbox = gis_models.PolygonField(
         null=True,
-        help_text="Spatial bounding box for quick filtering"
+        editable=False,
+        help_text="Spatial bounding box for quick filtering, derived on save"
     )
 
     # Properties and status
@@ -70,7 +112,7 @@ class ComponentInstance(gis_models.Model):
 
     status = models.CharField(
         max_length=20,
-        choices=ComponentStatus.choices(),
+        choices=ComponentStatus.choices,
         default=ComponentStatus.PLANNED.value,
         help_text="Current status in lifecycle"
     )
@@ -97,13 +139,17 @@ class ComponentInstance(gis_models.Model):
         help_text="When status was last changed"
     )
 
+    objects = ComponentInstanceQuerySet.as_manager()
+
     class Meta:
         db_table = 'et_component_instance'
         indexes = [
             models.Index(fields=['internal_id']),
             models.Index(fields=['status']),
-            models.Index(fields=['component']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['component', 'status'], name='et_instance_comp_status_idx'),
+            BrinIndex(fields=['created_at'], pages_per_range=32, name='et_instance_created_brin'),
+            SpGistIndex(fields=['spatial_data'], name='et_instance_geom_spgist'),
+            GinIndex(fields=['instance_properties'], opclasses=['jsonb_path_ops'], name='et_inst_iprops_gin'),
         ]
 
     def clean(self):
@@ -125,13 +171,10 @@ class ComponentInstance(gis_models.Model):
         if not self.spatial_data:
             return
 
-        coords = self.spatial_data.coords
-        for coord in coords[0]:
-            x, y, z = coord
-            if any(c % 25 != 0 for c in (x, y)):
-                raise ValidationError({
-                    'spatial_data': 'Geometry must align with 25mm grid system'
-                })
+        if not is_grid_aligned(self.spatial_data):
+            raise ValidationError({
+                'spatial_data': 'Geometry must align with 25mm grid system'
+            })
 
     def _validate_property_schema(self):
         """Validate instance properties conform to component-defined schemas."""
@@ -155,8 +198,7 @@ class ComponentInstance(gis_models.Model):
         Args:
             new_status (str): New status value from ComponentStatus enum
         """
-        valid_statuses = [status.value for status in ComponentStatus]
-        if new_status not in valid_statuses:
+        if new_status not in _VALID_STATUSES:
             raise ValueError(f"Invalid status: {new_status}")
         
         self.status = new_status
@@ -165,36 +207,80 @@ class ComponentInstance(gis_models.Model):
 
     def create_new_version(self):
         """Create a new version of this instance."""
-        # Get the next available internal_id
-        last_internal_id = ComponentInstance.objects.all().order_by('-internal_id').first()
-        next_internal_id = (last_internal_id.internal_id + 1) if last_internal_id else 1
-    
         new_instance = ComponentInstance.objects.create(
             component=self.component,
             spatial_data=self.spatial_data,
-            spatial_bbox=self.spatial_bbox,
             instance_properties=self.instance_properties,
             version=self.version + 1,
-            status=self.status,
-            internal_id=next_internal_id 
+            status=self.status
         )
         return new_instance
+
+    @classmethod
+    def bulk_instantiate(cls, component, specs, batch_size=1000):
+        """
+        Create many instances of a component with one multi-row INSERT.
+
+        Args:
+            component (Component): Parent component of every new instance
+            specs (iterable): One dict of field values per instance; missing
+                spatial_data defaults to the component's base geometry
+            batch_size (int): Maximum number of rows per INSERT statement
+
+        Returns:
+            list: The created ComponentInstance objects
+
+        Raises:
+            ValidationError: If any instance fails validation; nothing is saved
+        """
+        instances = []
+        for spec in specs:
+            instance = cls(component=component, **spec)
+            if instance.spatial_data is None:
+                instance.spatial_data = component.base_geometry
+            instance.clean_fields(exclude=['internal_id'])
+            instance._validate_spatial_integrity()
+            instance._validate_property_schema()
+            # Grid alignment is left to the et_check_grid_25mm CHECK constraint
+            instance.calculate_bounding_box()
+            instance.internal_id = NextVal(INTERNAL_ID_SEQUENCE)
+            instances.append(instance)
+
+        try:
+            with transaction.atomic():
+                return cls.objects.bulk_create(instances, batch_size=batch_size)
+        except IntegrityError as e:
+            raise ValidationError(f"Bulk instantiation rejected by database: {e}") from e
+
     def calculate_bounding_box(self):
-        """Calculate and update the spatial bounding box."""
+        """
+        Derive the spatial bounding box from the geometry. Computed in-process
+        so that save() writes it with the same INSERT/UPDATE; always a Polygon,
+        even for points and axis-parallel lines.
+        """
         if self.spatial_data:
-            self.spatial_bbox = self.spatial_data.envelope3d
-            self.save(update_fields=['spatial_bbox'])
+            self.spatial_bbox = bounding_polygon(self.spatial_data)
+        return self.spatial_bbox
 
     def save(self, *args, **kwargs):
         """Override save to ensure validation, bounding box calculation, and internal_id."""
-        self.full_clean()
+        self.clean_fields(exclude=['id', 'internal_id', 'created_at', 'modified_at', 'status_changed_at'])
+        self.clean()
         if self._state.adding:
-            last_internal_id = ComponentInstance.objects.all().order_by('-internal_id').first()
-            self.internal_id = (last_internal_id.internal_id + 1) if last_internal_id else 1
-        if not self.spatial_bbox and self.spatial_data:
-            self.calculate_bounding_box()
-        super().save(*args, **kwargs)
+            # Assigned by the database sequence within the INSERT
+            self.internal_id = NextVal(INTERNAL_ID_SEQUENCE)
+        self.calculate_bounding_box()
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            raise ValidationError(f"Component instance rejected by database: {e}") from e
 
     def __str__(self):
-        """String representation of the component instance."""
+        """
+        String representation of the component instance.
+
+        Reads self.component, so querysets rendered in bulk (admin lists,
+        serializers) should use ComponentInstance.objects.select_related('component').
+        """
         return f"{self.component.name} Instance {self.internal_id} (v{self.version})"
\ No newline at end of file
@@ -6,12 +6,105 @@ This model defines parametric attributes that can be assigned to components,
 serving as a crucial element in implementing parametric design principles.
 """
 
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.db.models import JSONField
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator
-import uuid
-from typing import Dict, Any
+from django.utils.functional import cached_property
+from typing import Callable, Dict, Any, Optional
+
+import numpy as np
+
+from ._kernels import valid_steps
+from ..utils.uuid7 import uuid7
+
+def _is_valid_step(value: float, step: float, min_val: float) -> bool:
+    """
+    Check if a value follows the step constraint from the minimum value.
+
+    Args:
+        value (float): The value to check
+        step (float): The step size
+        min_val (float): The minimum value
+
+    Returns:
+        bool: True if the value follows the step constraint
+    """
+    if min_val is None:
+        min_val = 0
+    # Account for floating point precision issues
+    tolerance = 1e-10
+    steps_from_min = (value - min_val) / step
+    return abs(round(steps_from_min) - steps_from_min) < tolerance
+
+def _range_limits(valid_ranges) -> tuple:
+    """
+    Extract numeric (min, max, step) from a valid_ranges document; missing or
+    non-numeric entries come back as None, as in et_sync_parameter_range_columns.
+    """
+    if not isinstance(valid_ranges, dict):
+        return None, None, None
+    return tuple(
+        value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+        for value in (valid_ranges.get('min'), valid_ranges.get('max'), valid_ranges.get('step'))
+    )
+
+# Expected Python types and error wording per data type; other types are unchecked
+_TYPE_CHECKS = {
+    'float': ((int, float), "Value must be numeric"),
+    'integer': (int, "Value must be an integer"),
+    'boolean': (bool, "Value must be boolean"),
+    'json': (dict, "Value must be a dictionary"),
+}
+
+def _make_validator(data_type: str, is_required: bool, name: str,
+                    min_val: Optional[float] = None, max_val: Optional[float] = None,
+                    step: Optional[float] = None) -> Callable[[Any], bool]:
+    """
+    Build a validator closure specialised for one parameter definition.
+
+    The data type dispatch and range lookups happen once here; the returned
+    function only reads its captured locals.
+
+    Raises (from the closure):
+        ValidationError: If the value violates any constraints
+    """
+    expected, type_message = _TYPE_CHECKS.get(data_type, (None, None))
+
+    def validate(value: Any) -> bool:
+        if value is None:
+            if is_required:
+                raise ValidationError(f"Parameter {name} is required")
+            return True
+
+        if expected is not None and not isinstance(value, expected):
+            raise ValidationError(f"{type_message} for parameter {name}")
+
+        if min_val is not None and value < min_val:
+            raise ValidationError(f"Value must be >= {min_val} for parameter {name}")
+        if max_val is not None and value > max_val:
+            raise ValidationError(f"Value must be <= {max_val} for parameter {name}")
+        if step is not None and not _is_valid_step(value, step, min_val):
+            raise ValidationError(
+                f"Value must be in steps of {step} from {min_val} for parameter {name}"
+            )
+        return True
+
+    return validate
+
+class ParameterQuerySet(models.QuerySet):
+    """Query helpers for parameters."""
+
+    def lightweight(self):
+        """
+        Load only the columns list views display, leaving the valid_ranges JSON
+        and description text unfetched. The range columns are included so that
+        validate_value() and validate_array() need no deferred-field queries.
+        """
+        return self.only(
+            'id', 'component', 'name', 'data_type', 'units', 'is_required',
+            'min_value', 'max_value', 'step_value'
+        )
 
 class Parameter(models.Model):
     """
@@ -23,7 +116,7 @@ class Parameter(models.Model):
     # Core fields
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the parameter"
     )
@@ -67,6 +160,29 @@ class Parameter(models.Model):
         help_text="Defines acceptable value ranges and constraints"
     )
 
+    # Numeric limits derived from valid_ranges, by clean() in Python and by the
+    # et_parameter_sync_range_columns trigger on every database write
+    min_value = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Minimum allowed value for numeric parameters"
+    )
+
+    max_value = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Maximum allowed value for numeric parameters"
+    )
+
+    step_value = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Step size from the minimum for numeric parameters"
+    )
+
     is_required = models.BooleanField(
         default=False,
         help_text="Indicates if parameter is mandatory"
@@ -81,6 +197,8 @@ class Parameter(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = ParameterQuerySet.as_manager()
+
     class Meta:
         db_table = 'et_parameter'
         indexes = [
@@ -99,8 +217,10 @@ class Parameter(models.Model):
         """
         Validate the parameter according to EuroTempl business rules.
         """
+        self._reset_validators()
         self._validate_units()
         self._validate_valid_ranges()
+        self._sync_range_columns()
         super().clean()
 
     def _validate_units(self) -> None:
@@ -129,18 +249,66 @@ class Parameter(models.Model):
                     'valid_ranges': 'Numeric parameters must specify min and max values'
                 })
 
+            if not all(isinstance(self.valid_ranges[key], (int, float)) for key in required_keys):
+                raise ValidationError({
+                    'valid_ranges': 'Min and max values must be numeric'
+                })
+
             if ('step' in self.valid_ranges and 
                 not isinstance(self.valid_ranges['step'], (int, float))):
                 raise ValidationError({
                     'valid_ranges': 'Step value must be numeric'
                 })
 
-    def validate_value(self, value: Any) -> bool:
+    def _sync_range_columns(self) -> None:
+        """
+        Copy numeric limits from valid_ranges into the min/max/step columns.
+        """
+        self.min_value, self.max_value, self.step_value = self._range_limits()
+
+    def _range_limits(self) -> tuple:
+        """
+        Numeric (min, max, step) for this parameter.
+
+        Derived from valid_ranges whenever it is loaded, so unsaved or
+        uncleaned definitions are enforced too. Rows loaded with valid_ranges
+        deferred (see ParameterQuerySet.lightweight) read the columns, which
+        the database keeps in step with valid_ranges.
+        """
+        if self.data_type not in {'float', 'integer'}:
+            return None, None, None
+        if 'valid_ranges' in self.get_deferred_fields():
+            return self.min_value, self.max_value, self.step_value
+        return _range_limits(self.valid_ranges)
+
+    @cached_property
+    def _validator(self) -> Callable[[Any], bool]:
+        """Validator specialised for this parameter's type and ranges."""
+        return _make_validator(
+            self.data_type, self.is_required, self.name, *self._range_limits()
+        )
+
+    @cached_property
+    def _type_validator(self) -> Callable[[Any], bool]:
+        """Like _validator, without the min/max/step checks."""
+        return _make_validator(self.data_type, self.is_required, self.name)
+
+    def _reset_validators(self) -> None:
+        """Drop the specialised validators after the definition changes."""
+        self.__dict__.pop('_validator', None)
+        self.__dict__.pop('_type_validator', None)
+
+    def validate_value(self, value: Any, check_range: bool = True) -> bool:
         """
         Validate a given value against this parameter's constraints.
 
+        Dispatches to a closure built once per loaded definition; clean() and
+        refresh_from_db() rebuild it after the definition changes.
+
         Args:
             value: The value to validate
+            check_range: Also apply min/max/step; callers validating a whole
+                batch with validate_array() pass False
 
         Returns:
             bool: True if the value is valid, False otherwise
@@ -148,77 +316,109 @@ class Parameter(models.Model):
         Raises:
             ValidationError: If the value violates any constraints
         """
-        if value is None:
-            if self.is_required:
-                raise ValidationError(f"Parameter {self.name} is required")
-            return True
+        if check_range:
+            return self._validator(value)
+        return self._type_validator(value)
 
-        # Type validation
-        if self.data_type == 'float':
-            if not isinstance(value, (int, float)):
-                raise ValidationError(f"Value must be numeric for parameter {self.name}")
-        elif self.data_type == 'integer':
-            if not isinstance(value, int):
-                raise ValidationError(f"Value must be an integer for parameter {self.name}")
-        elif self.data_type == 'boolean':
-            if not isinstance(value, bool):
-                raise ValidationError(f"Value must be boolean for parameter {self.name}")
-        elif self.data_type == 'json':
-            if not isinstance(value, dict):
-                raise ValidationError(f"Value must be a dictionary for parameter {self.name}")
-
-        # Range validation for numeric types
-        if self.data_type in {'float', 'integer'} and self.valid_ranges:
-            min_val = self.valid_ranges.get('min')
-            max_val = self.valid_ranges.get('max')
-            step = self.valid_ranges.get('step')
-
-            if min_val is not None and value < min_val:
-                raise ValidationError(f"Value must be >= {min_val} for parameter {self.name}")
-            if max_val is not None and value > max_val:
-                raise ValidationError(f"Value must be <= {max_val} for parameter {self.name}")
-            if step is not None:
-                if not self._is_valid_step(value, step, min_val):
-                    raise ValidationError(
-                        f"Value must be in steps of {step} from {min_val} for parameter {self.name}"
-                    )
-
-        return True
-
-    def _is_valid_step(self, value: float, step: float, min_val: float) -> bool:
+    def validate_array(self, arr) -> np.ndarray:
         """
-        Check if a value follows the step constraint from the minimum value.
+        Check a batch of numeric values against this parameter's min, max and
+        step constraints in branchless vectorised passes, for importers
+        validating many values at once. Types are not checked here.
 
         Args:
-            value (float): The value to check
-            step (float): The step size
-            min_val (float): The minimum value
+            arr: Sequence or array of numeric values
 
         Returns:
-            bool: True if the value follows the step constraint
+            np.ndarray: Boolean mask, True where the value is within range
         """
-        if min_val is None:
-            min_val = 0
-        # Account for floating point precision issues
-        tolerance = 1e-10
-        steps_from_min = (value - min_val) / step
-        return abs(round(steps_from_min) - steps_from_min) < tolerance
+        arr = np.asarray(arr, dtype=np.float64)
+        mask = np.ones(arr.shape, dtype=bool)
+        min_val, max_val, step = self._range_limits()
+        if min_val is not None:
+            mask &= arr >= min_val
+        if max_val is not None:
+            mask &= arr <= max_val
+        if step is not None:
+            mask &= valid_steps(arr, step, 0.0 if min_val is None else min_val)
+        return mask
 
     def get_values(self):
         """
         Retrieve all ParameterValue instances associated with this parameter.
 
+        Uses values prefetched through Component.with_parameter_values() when
+        available; load components that way before iterating many parameters.
+
         Returns:
             QuerySet: All ParameterValue instances for this parameter
         """
         return self.parametervalue_set.all()
 
+    @classmethod
+    def bulk_insert(cls, params, batch_size=1000):
+        """
+        Validate and insert many parameters with multi-row INSERTs, skipping
+        the per-row full_clean() and its uniqueness queries.
+
+        Args:
+            params (iterable): Unsaved Parameter objects
+            batch_size (int): Maximum number of rows per INSERT statement
+
+        Returns:
+            list: The created Parameter objects
+
+        Raises:
+            ValidationError: If any parameter fails validation or its name is
+                already taken on its component; nothing is saved
+        """
+        params = list(params)
+        seen = set()
+        for param in params:
+            # Component existence is enforced by the foreign key
+            param.clean_fields(exclude=['id', 'component'])
+            param.clean()
+            key = (param.component_id, param.name)
+            if key in seen:
+                raise ValidationError(f"Duplicate parameter {param.name} in batch")
+            seen.add(key)
+
+        existing = set(
+            cls.objects.filter(
+                component_id__in={component_id for component_id, _ in seen},
+                name__in={name for _, name in seen}
+            ).values_list('component_id', 'name')
+        )
+        clashes = seen & existing
+        if clashes:
+            names = sorted(name for _, name in clashes)
+            raise ValidationError(f"Parameters already exist: {', '.join(names)}")
+
+        try:
+            with transaction.atomic():
+                return cls.objects.bulk_create(params, batch_size=batch_size)
+        except IntegrityError as e:
+            raise ValidationError(f"Bulk insert rejected by database: {e}") from e
+
     def save(self, *args, **kwargs):
         """
         Override save to ensure validation is always performed.
+
+        Name uniqueness is enforced by unique_parameter_name_per_component
+        rather than probed with a SELECT first; violations surface as
+        ValidationError.
         """
-        self.full_clean()
-        super().save(*args, **kwargs)
+        self.full_clean(validate_unique=False, validate_constraints=False)
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            raise ValidationError(f"Parameter rejected by database: {e}") from e
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload from the database and drop validators built from the old definition."""
+        super().refresh_from_db(*args, **kwargs)
+        self._reset_validators()
 
     def __str__(self) -> str:
         """
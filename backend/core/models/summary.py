@@ -0,0 +1,51 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Read-only per-component relation counts backed by the et_component_summary
+materialized view.
+"""
+
+from django.db import connection, models
+
+
+class ComponentSummary(models.Model):
+    """
+    Denormalized parameter, material requirement and documentation counts for
+    a component. Listing views can read the counts in a single query instead of
+    fetching three related collections per component.
+
+    The view is not refreshed automatically; call refresh() after bulk changes
+    or on a schedule.
+    """
+
+    component = models.OneToOneField(
+        'Component',
+        primary_key=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='summary',
+        help_text="Summarized component"
+    )
+    param_count = models.IntegerField(help_text="Number of parameters")
+    mat_count = models.IntegerField(help_text="Number of material requirements")
+    doc_count = models.IntegerField(help_text="Number of documentation entries")
+
+    class Meta:
+        managed = False
+        db_table = 'et_component_summary'
+
+    def __str__(self):
+        return f"Summary of {self.component_id}"
+
+    @classmethod
+    def refresh(cls, concurrently=True):
+        """
+        Rebuild the materialized view.
+
+        Args:
+            concurrently: Refresh without locking out readers; relies on the
+                unique index over component_id
+        """
+        option = ' CONCURRENTLY' if concurrently else ''
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW{option} {cls._meta.db_table}')
@@ -6,13 +6,60 @@ This model represents the concrete values of parameters for specific component i
 serving as a bridge between abstract parameter definitions and their implementations.
 """
 
-from django.db import models
-from django.db.models import JSONField
+from django.db import models, transaction, IntegrityError
+from django.db.models import F, JSONField, Q
+from django.db.models.fields.json import KeyTransform
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-import uuid
+from django.utils.functional import cached_property
 from typing import Any, Dict, Optional
 
+from ..utils.uuid7 import uuid7
+
+class ParameterValueQuerySet(models.QuerySet):
+    """Query helpers for parameter values."""
+
+    def with_related(self):
+        """
+        Join the parameter, instance and modifying user into the same query, so
+        __str__ and validation on each row do not trigger extra lookups.
+        """
+        return self.select_related('parameter', 'instance', 'modified_by')
+
+    def with_names(self):
+        """
+        Annotate each row with its parameter's name, which __str__ prefers, so
+        rendering values needs no parameter rows at all.
+        """
+        return self.annotate(parameter_name=F('parameter__name'))
+
+    def lightweight(self):
+        """
+        Load only the columns list views display, leaving the value JSON
+        unfetched.
+        """
+        return self.only('id', 'instance', 'parameter', 'validation_status', 'recorded_at')
+
+    def with_value(self, value):
+        """
+        Return rows whose stored value equals value, using JSONB containment
+        (@>) so the pv_value_gin index answers the lookup.
+        """
+        return self.filter(value__contains={'value': value})
+
+    def numeric_gte(self, threshold):
+        """
+        Return numeric values greater than or equal to threshold. The
+        comparison runs on the jsonb value through the pv_value_idx index;
+        restricting to numeric parameters keeps jsonb's cross-type ordering
+        (booleans and objects sort above numbers) out of the result.
+        """
+        return self.filter(
+            value__value__gte=threshold,
+            parameter__data_type__in=['float', 'integer']
+        )
+
 class ParameterValue(models.Model):
     """
     The ParameterValue model stores and manages actual values of parameters for specific
@@ -23,7 +70,7 @@ class ParameterValue(models.Model):
     # Core fields
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the parameter value"
     )
@@ -72,25 +119,45 @@ class ParameterValue(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = ParameterValueQuerySet.as_manager()
+
     class Meta:
         db_table = 'et_parameter_value'
         indexes = [
-            models.Index(fields=['instance']),
+            # Lookups by instance are served by unique_parameter_per_instance
             models.Index(fields=['parameter']),
-            models.Index(fields=['validation_status']),
-            models.Index(fields=['recorded_at']),
+            # Partial indexes: only rows needing attention, and only valid history
+            models.Index(
+                fields=['validation_status'],
+                name='pv_invalid_idx',
+                condition=Q(validation_status__in=['invalid', 'pending'])
+            ),
+            models.Index(
+                fields=['recorded_at'],
+                name='pv_recent_idx',
+                condition=Q(validation_status='valid')
+            ),
+            GinIndex(fields=['value'], opclasses=['jsonb_path_ops'], name='pv_value_gin'),
+            models.Index(KeyTransform('value', 'value'), name='pv_value_idx'),
         ]
         constraints = [
             models.UniqueConstraint(
                 fields=['instance', 'parameter'],
                 name='unique_parameter_per_instance'
-            )
+            ),
+            # Range limits live on the parameter and are enforced by the
+            # et_parameter_value_range trigger (migration 0021)
+            models.CheckConstraint(
+                check=Q(value__has_key='value'),
+                name='pv_has_value_key'
+            ),
         ]
 
     def clean(self) -> None:
         """
         Validate the parameter value according to EuroTempl business rules.
         """
+        self._reset_value_cache()
         self._validate_temporal_integrity()
         self._validate_value_constraints()
         self._validate_required_parameter()
@@ -106,20 +173,26 @@ class ParameterValue(models.Model):
                     'recorded_at': 'Value cannot be recorded before instance creation'
                 })
 
-    def _validate_value_constraints(self) -> None:
+    def _validate_value_constraints(self, check_range: bool = True) -> None:
         """
         Validate value against parameter constraints and data type.
+
+        Args:
+            check_range: Also apply the parameter's min/max/step constraints
         """
         if self.value is None:
             raise ValidationError("Value cannot be None")
 
         try:
+            if not isinstance(self.value, dict):
+                raise ValidationError("Value must be an object with a 'value' key")
+
             # Use parameter's validate_value method for type and range validation
-            self.parameter.validate_value(self.value.get('value'))
+            self.parameter.validate_value(self.scalar_value, check_range=check_range)
             
             # Validate units if specified
             if self.parameter.units:
-                provided_unit = self.value.get('unit')
+                provided_unit = self.unit
                 if not provided_unit:
                     raise ValidationError("Unit must be specified for this parameter")
                 if provided_unit != self.parameter.units:
@@ -136,15 +209,32 @@ class ParameterValue(models.Model):
         """
         Ensure required parameters have valid values.
         """
-        if self.parameter.is_required and (
-            self.value is None or 
-            'value' not in self.value or 
-            self.value['value'] is None
-        ):
+        if self.parameter.is_required and self.scalar_value is None:
             raise ValidationError({
                 'value': f"Required parameter {self.parameter.name} must have a value"
             })
 
+    @cached_property
+    def scalar_value(self) -> Any:
+        """
+        The actual value extracted from the JSONB field, computed once per load.
+        """
+        value = self.value
+        return value.get('value') if isinstance(value, dict) else value
+
+    @cached_property
+    def unit(self) -> Optional[str]:
+        """
+        The unit stored alongside the value, if any.
+        """
+        value = self.value
+        return value.get('unit') if isinstance(value, dict) else None
+
+    def _reset_value_cache(self) -> None:
+        """Drop the cached scalar_value and unit after self.value changes."""
+        self.__dict__.pop('scalar_value', None)
+        self.__dict__.pop('unit', None)
+
     def get_value(self) -> Any:
         """
         Retrieve the actual value from the JSONB field.
@@ -152,7 +242,7 @@ class ParameterValue(models.Model):
         Returns:
             Any: The parameter value
         """
-        return self.value.get('value') if isinstance(self.value, dict) else self.value
+        return self.scalar_value
 
     def set_value(self, new_value: Any, unit: Optional[str] = None) -> None:
         """
@@ -175,38 +265,83 @@ class ParameterValue(models.Model):
             value_dict['unit'] = unit
 
         self.value = value_dict
-        self.validate_and_save()
+        self._reset_value_cache()
+        if self._state.adding:
+            self.validate_and_save()
+        else:
+            # Only these columns change; skip rewriting the rest of the row
+            self.validate_and_save(update_fields=['value', 'validation_status', 'modified_at'])
 
     def validate_and_save(self, *args, **kwargs) -> None:
         """
         Validate and save the parameter value, updating validation status.
+
+        Uniqueness and constraints are left to the database rather than probed
+        with extra SELECTs; violations surface as ValidationError.
         """
         try:
-            self.full_clean()
+            self.full_clean(validate_unique=False, validate_constraints=False)
             self.validation_status = 'valid'
         except ValidationError:
             self.validation_status = 'invalid'
             raise
-        
-        super().save(*args, **kwargs)
 
-    def save(self, *args, **kwargs):
-        """Override save to handle validation status."""
-        # Validate the value before saving
         try:
-            self.validate_value()
-            self.validation_status = 'valid'
-        except ValidationError:
-            self.validation_status = 'invalid'
-        
-        self.full_clean()
-        super().save(*args, **kwargs)
-    
-    def validate_value(self):
-        """Validate the value against parameter constraints."""
-        # Add validation logic here
-        # For now, assume all values are valid
-        pass
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            raise ValidationError(f"Parameter value rejected by database: {e}") from e
+
+    @classmethod
+    def bulk_insert(cls, values, batch_size=1000):
+        """
+        Validate and insert many parameter values with multi-row INSERTs.
+
+        Parameter definitions are loaded once for the whole batch instead of
+        per row. Numeric ranges are enforced by the et_parameter_value_range
+        trigger and uniqueness by the unique_parameter_per_instance constraint,
+        so neither is checked in Python.
+
+        Args:
+            values (iterable): Unsaved ParameterValue objects
+            batch_size (int): Maximum number of rows per INSERT statement
+
+        Returns:
+            list: The created ParameterValue objects
+
+        Raises:
+            ValidationError: If any value fails validation; nothing is saved
+        """
+        from .parameter import Parameter  # Avoid circular import
+
+        values = list(values)
+        parameters = Parameter.objects.in_bulk({value.parameter_id for value in values})
+        for value in values:
+            try:
+                value.parameter = parameters[value.parameter_id]
+            except KeyError:
+                raise ValidationError(f"Unknown parameter {value.parameter_id}")
+            # Foreign keys are enforced by the database; recorded_at is set on
+            # insert, so it cannot predate the instance
+            value.clean_fields(exclude=['id', 'instance', 'parameter', 'modified_by'])
+            value._validate_value_constraints(check_range=False)
+            value._validate_required_parameter()
+            value.validation_status = 'valid'
+
+        try:
+            with transaction.atomic():
+                return cls.objects.bulk_create(values, batch_size=batch_size)
+        except IntegrityError as e:
+            raise ValidationError(f"Bulk insert rejected by database: {e}") from e
+
+    def save(self, *args, **kwargs):
+        """Override save so every write goes through validate_and_save."""
+        self.validate_and_save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload from the database and drop values derived from the old JSON."""
+        super().refresh_from_db(*args, **kwargs)
+        self._reset_value_cache()
 
     def __str__(self) -> str:
         """
@@ -215,7 +350,8 @@ class ParameterValue(models.Model):
         Returns:
             str: A string describing the parameter value
         """
+        name = getattr(self, 'parameter_name', None) or self.parameter.name
         return (
-            f"{self.parameter.name} = {self.get_value()} "
+            f"{name} = {self.scalar_value} "
             f"({self.validation_status})"
         )
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Memoised WKT parsing for the core test suite.
+"""
+
+import functools
+from django.contrib.gis.geos import GEOSGeometry
+
+# Polygon off the 25mm grid, used by the grid alignment tests
+MISALIGNED_WKT = 'POLYGON Z ((0 0 0, 0 12.3 0, 12.3 12.3 0, 12.3 0 0, 0 0 0))'
+
+@functools.lru_cache(maxsize=64)
+def wkt_geom(wkt, srid=4326):
+    """
+    Parse a WKT string once and return the cached geometry.
+
+    GEOS geometries are mutable, so callers must .clone() the result before
+    assigning it to a model.
+    """
+    return GEOSGeometry(wkt, srid=srid)
@@ -0,0 +1,167 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Shared fixtures for the core test suite.
+"""
+
+import itertools
+import pytest
+from core.models import Component, ComponentInstance, ComponentStatus
+from ._geom_cache import wkt_geom
+
+@pytest.fixture(scope='class')
+def class_transaction(django_db_setup, django_db_blocker):
+    """
+    Fixture wrapping a whole test class in one transaction, rolled back when
+    the class finishes, for class-scoped fixtures that create shared rows.
+
+    The per-test atomic block opened by the django_db mark nests inside it as
+    a savepoint, so each test is still isolated. Database access is unblocked
+    only while entering and leaving the transaction and inside the returned
+    setup(func, *args, **kwargs) callable, which class-scoped fixtures use to
+    create their rows.
+    """
+    from django.db import transaction
+
+    atomic = transaction.atomic()
+    with django_db_blocker.unblock():
+        atomic.__enter__()
+
+    def setup(func, *args, **kwargs):
+        with django_db_blocker.unblock():
+            return func(*args, **kwargs)
+
+    yield setup
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+
+@pytest.fixture(scope='session')
+def sequence():
+    """Fixture providing a session-wide counter for deterministic unique values."""
+    return itertools.count(1)
+
+@pytest.fixture(scope='session')
+def base_polygon():
+    """
+    Fixture providing the 25mm grid-aligned 3D test polygon, parsed once.
+
+    GEOS geometries are mutable, so callers must take a .clone() rather than
+    handing this instance to a model.
+    """
+    return wkt_geom('POLYGON Z ((0 0 0, 0 25 0, 25 25 0, 25 0 0, 0 0 0))')
+
+@pytest.fixture(scope='session')
+def base_bbox():
+    """
+    Fixture providing the bounding box of base_polygon, built straight from
+    its known extent rather than asking GEOS for the envelope.
+    """
+    from django.contrib.gis.geos import Polygon
+
+    bbox = Polygon.from_bbox((0, 0, 25, 25))
+    bbox.srid = 4326
+    return bbox
+
+@pytest.fixture
+def valid_component_data(base_polygon):
+    """Fixture providing valid component data."""
+    geometry = base_polygon.clone()
+    
+    return {
+        'classification': 'ET_AUD_PROC_AMP_001',
+        'name': 'amplify-signal',
+        'version': '1.0.0',
+        'functional_properties': {
+            'acoustic_rating': 'A',
+            'emi_shield_level': '2'
+        },
+        'base_geometry': geometry,
+        'core_mission': 'Amplify audio signal with minimal distortion'
+    }
+
+@pytest.fixture(scope='session')
+def valid_component(django_db_setup, django_db_blocker, base_polygon):
+    """
+    Fixture providing a valid component, created once per session.
+
+    The row lives outside the per-test transactions, so tests must not modify
+    it; fetch a separate copy with Component.objects.get(pk=...) if needed.
+    Its classification differs from valid_component_data so component tests
+    can still create that one.
+    """
+    with django_db_blocker.unblock():
+        component, _ = Component.objects.get_or_create(
+            classification='ET_AUD_PROC_AMP_900',
+            version='1.0.0',
+            defaults={
+                'name': 'shared-amplifier',
+                'functional_properties': {
+                    'acoustic_rating': 'A',
+                    'emi_shield_level': '2'
+                },
+                'base_geometry': base_polygon.clone(),
+                'core_mission': 'Shared component for instance and parameter tests'
+            }
+        )
+    yield component
+    with django_db_blocker.unblock():
+        component.delete()
+
+@pytest.fixture(scope='session')
+def test_user(django_db_setup, django_db_blocker):
+    """
+    Fixture providing a test user, created once per session.
+
+    No test logs in, so the user gets an unusable password and skips
+    password hashing altogether.
+    """
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    with django_db_blocker.unblock():
+        user, created = User.objects.get_or_create(
+            username='testuser', defaults={'email': 'test@example.com'}
+        )
+        if created:
+            user.set_unusable_password()
+            user.save(update_fields=['password'])
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+@pytest.fixture(scope='session')
+def validated_instance_data(django_db_setup, django_db_blocker, valid_component,
+                            base_polygon, base_bbox):
+    """
+    Fixture providing baseline component instance data, fully validated once.
+
+    Per-test fixtures copy this data and may insert it with a plain
+    bulk_create instead of paying for the same field, spatial and grid
+    checks in every test. Treat the dict as read-only and clone its
+    geometries.
+    """
+    data = {
+        'component': valid_component,
+        'spatial_data': base_polygon,
+        'spatial_bbox': base_bbox,
+        'instance_properties': {
+            'material': 'steel',
+            'finish': 'matte'
+        },
+        'status': ComponentStatus.PLANNED.value,
+        'version': 1
+    }
+    with django_db_blocker.unblock():
+        ComponentInstance(**data).full_clean(exclude=['internal_id'])
+    return data
+
+@pytest.fixture
+def valid_instance_data(validated_instance_data):
+    """Fixture providing valid component instance data."""
+    return {
+        **validated_instance_data,
+        'spatial_data': validated_instance_data['spatial_data'].clone(),
+        'spatial_bbox': validated_instance_data['spatial_bbox'].clone(),
+        'instance_properties': dict(validated_instance_data['instance_properties'])
+    }
@@ -5,30 +5,8 @@ import pytest
 from django.core.exceptions import ValidationError
 from django.contrib.gis.geos import Point, Polygon, MultiPolygon
 import uuid
-from core.models import Component
-
-@pytest.fixture
-def valid_component_data():
-    """Fixture providing valid component data."""
-    from django.contrib.gis.geos import GEOSGeometry
-    
-    # Create a 3D polygon using WKT format
-    wkt = (
-        'POLYGON Z ((0 0 0, 0 25 0, 25 25 0, 25 0 0, 0 0 0))'
-    )
-    geometry = GEOSGeometry(wkt, srid=4326)
-    
-    return {
-        'classification': 'ET_AUD_PROC_AMP_001',
-        'name': 'amplify-signal',
-        'version': '1.0.0',
-        'functional_properties': {
-            'acoustic_rating': 'A',
-            'emi_shield_level': '2'
-        },
-        'base_geometry': geometry,
-        'core_mission': 'Amplify audio signal with minimal distortion'
-    }
+from core.models import Component, ComponentSummary, Documentation, MaterialRequirement, Parameter
+from ._geom_cache import MISALIGNED_WKT, wkt_geom
 
 @pytest.mark.django_db
 class TestComponent:
@@ -47,12 +25,32 @@ class TestComponent:
         with pytest.raises(ValidationError):
             Component.objects.create(**valid_component_data)
 
+        valid_component_data['classification'] = 'ET_AUD_PROC_AMP_001\n'
+        with pytest.raises(ValidationError):
+            Component.objects.create(**valid_component_data)
+
     def test_version_semantic_validation(self, valid_component_data):
         """Test semantic versioning validation."""
         valid_component_data['version'] = 'invalid.version'
         with pytest.raises(ValidationError):
             Component.objects.create(**valid_component_data)
 
+    @pytest.mark.parametrize('version, is_valid', [
+        ('v1.2.3', True),
+        ('1.2.3-rc.1+build.5', True),
+        ('01.2.3', False),
+        ('1.2', False),
+        ('1.0.0\n', False),
+    ])
+    def test_version_formats(self, valid_component_data, version, is_valid):
+        """Test accepted and rejected semantic version formats."""
+        valid_component_data['version'] = version
+        if is_valid:
+            assert Component.objects.create(**valid_component_data).version == version
+        else:
+            with pytest.raises(ValidationError):
+                Component.objects.create(**valid_component_data)
+
     def test_functional_properties_validation(self, valid_component_data):
         """Test required functional properties validation."""
         valid_component_data['functional_properties'] = {}
@@ -61,12 +59,7 @@ class TestComponent:
 
     def test_grid_alignment_validation(self, valid_component_data):
         """Test 25mm grid alignment validation."""
-        from django.contrib.gis.geos import GEOSGeometry
-        
-        misaligned_wkt = (
-            'POLYGON Z ((0 0 0, 0 12.3 0, 12.3 12.3 0, 12.3 0 0, 0 0 0))'
-        )
-        valid_component_data['base_geometry'] = GEOSGeometry(misaligned_wkt, srid=4326)
+        valid_component_data['base_geometry'] = wkt_geom(MISALIGNED_WKT).clone()
         
         with pytest.raises(ValidationError):
             Component.objects.create(**valid_component_data)
@@ -134,6 +127,43 @@ class TestComponent:
         result = method()
         assert hasattr(result, 'all')
 
+    def test_with_related(self, valid_component_data, django_assert_num_queries):
+        """Test prefetching of related collections."""
+        Component.objects.create(**valid_component_data)
+        with django_assert_num_queries(5):
+            for component in Component.with_related():
+                list(component.get_parameters())
+                list(component.get_material_requirements())
+                list(component.get_documentation())
+
+    def test_component_summary(self, valid_component_data):
+        """Test relation counts exposed through the summary view."""
+        component = Component.objects.create(**valid_component_data)
+        MaterialRequirement.objects.create(
+            component=component, material_code='PCB-001', quantity=1, unit='pcs'
+        )
+        Documentation.objects.create(
+            component=component, title='Assembly Guide', content='Step 1...', document_type='manual'
+        )
+        ComponentSummary.refresh()
+        summary = ComponentSummary.objects.get(component=component)
+        assert (summary.param_count, summary.mat_count, summary.doc_count) == (0, 1, 1)
+
+    def test_with_parameter_values(self, valid_component_data, django_assert_num_queries):
+        """Test prefetching of parameters and their values."""
+        component = Component.objects.create(**valid_component_data)
+        Parameter.objects.create(
+            component=component,
+            name='wall_thickness',
+            data_type='float',
+            units='mm',
+            valid_ranges={'min': 0, 'max': 100}
+        )
+        with django_assert_num_queries(3):
+            for component in Component.with_parameter_values():
+                for parameter in component.get_parameters():
+                    list(parameter.get_values())
+
     def test_create_instance_method(self, valid_component_data):
         """Test component instance creation."""
         component = Component.objects.create(**valid_component_data)
@@ -5,70 +5,75 @@ Test suite for the Connection model implementation.
 """
 
 import uuid
-import random
 import pytest
+from freezegun import freeze_time
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.contrib.gis.geos import GEOSGeometry, Polygon
+from django.contrib.gis.geos import LinearRing, Point, Polygon
 from datetime import timedelta
 from core.models import (
     Connection, 
     ComponentInstance, 
     ConnectionStatus,
-    ConnectionType, 
-    Component
+    ConnectionType
 )
-from .test_instance import valid_instance_data
-from .test_component import valid_component_data
-
-@pytest.fixture(autouse=True)
-def cleanup_db():
-    """Clean up the database before and after each test."""
-    Connection.objects.all().delete()
-    ComponentInstance.objects.all().delete()
-    yield
-    Connection.objects.all().delete()
-    ComponentInstance.objects.all().delete()
+from core.models.instance import INTERNAL_ID_SEQUENCE, NextVal
+from ._geom_cache import MISALIGNED_WKT, wkt_geom
 
-@pytest.fixture
-def valid_component(valid_component_data):
-    """Fixture providing a valid component."""
-    return Component.objects.create(**valid_component_data)
+def _instance_kwargs(base, **overrides):
+    """
+    Build one instance's field values from base in a single dict merge.
+    The component is left out, as _insert_validated_instances takes it
+    separately, and the geometry is cloned so sibling instances never share
+    a GEOS object.
+    """
+    kwargs = {**base, 'spatial_data': base['spatial_data'].clone(), **overrides}
+    del kwargs['component']
+    return kwargs
+
+def _insert_validated_instances(component, specs):
+    """
+    Insert instances with one bulk_create, skipping model validation.
+
+    Only for copies of validated_instance_data, which was validated once per
+    session. The database still assigns internal_id from the sequence and
+    enforces the grid constraint.
+    """
+    instances = []
+    for spec in specs:
+        instance = ComponentInstance(component=component, **spec)
+        instance.calculate_bounding_box()
+        instance.internal_id = NextVal(INTERNAL_ID_SEQUENCE)
+        instances.append(instance)
+    return ComponentInstance.objects.bulk_create(instances)
 
 @pytest.fixture
 def valid_component_instances(valid_instance_data):
     """Fixture providing two valid component instances for connection testing."""
-    # Create deep copies of the data for each instance
-    instance1_data = valid_instance_data.copy()
-    instance2_data = valid_instance_data.copy()
+    component = valid_instance_data['component']
+    instance1_data = _instance_kwargs(valid_instance_data)
+    instance2_data = _instance_kwargs(valid_instance_data)
     
-    # Set deterministic unique internal IDs for each instance
-    instance1_data['internal_id'] = 1
-    instance2_data['internal_id'] = 2
-    instance1_data['id'] = uuid.uuid4()
-    instance2_data['id'] = uuid.uuid4()
-    
-    # Create instances with unique data
-    instance1 = ComponentInstance.objects.create(**instance1_data)
-    instance2 = ComponentInstance.objects.create(**instance2_data)
+    # The baseline data was validated once per session; insert both rows at once
+    instance1, instance2 = _insert_validated_instances(
+        component, [instance1_data, instance2_data]
+    )
     
     return instance1, instance2
 
 @pytest.fixture
-def valid_connection_data(valid_component_instances):
+def valid_connection_data(valid_component_instances, sequence):
     """Fixture providing valid connection data."""
     instance1, instance2 = valid_component_instances
     
-    # Create a simple 3D polygon for testing
-    test_id = random.randint(0,100)*25  # Add randomness to ensure unique geometries
-
-    wkt = f'POLYGON Z (({test_id} 0 0, {test_id} 25 0, {test_id+25} 25 0, {test_id+25} 0 0, {test_id} 0 0))'
-    geometry = GEOSGeometry(wkt, srid=4326)
+    # Build the 25mm square straight from coordinates, no WKT involved
+    x = next(sequence) * 25  # Grid-aligned offset, unique per fixture call
+    ring = LinearRing((x, 0, 0), (x, 25, 0), (x + 25, 25, 0), (x + 25, 0, 0), (x, 0, 0))
+    geometry = Polygon(ring, srid=4326)
     
-    # Create the spatial bbox as a 2D polygon from the geometry's extent
-    bbox = geometry.extent  # Returns (xmin, ymin, xmax, ymax)
-    bbox_wkt = f'POLYGON (({bbox[0]} {bbox[1]}, {bbox[0]} {bbox[3]}, {bbox[2]} {bbox[3]}, {bbox[2]} {bbox[1]}, {bbox[0]} {bbox[1]}))'
-    spatial_bbox = GEOSGeometry(bbox_wkt, srid=4326)
+    # The extent is known, so the 2D bbox needs no GEOS round trip either
+    spatial_bbox = Polygon.from_bbox((x, 0, x + 25, 25))
+    spatial_bbox.srid = 4326
     
     return {
         'instance_1': instance1,
@@ -89,25 +94,34 @@ class TestConnection:
     """Test suite for Connection model."""
     def _create_fresh_instances(self, valid_instance_data):
         """Helper method to create fresh component instances."""
-        # Create deep copies of the data for each instance
-        instance1_data = valid_instance_data.copy()
-        instance2_data = valid_instance_data.copy()
-        
-        # Set unique IDs for each instance
-        instance1_data['internal_id'] = random.randint(0,9999999)
-        instance2_data['internal_id'] = random.randint(0,9999999)
-        instance1_data['id'] = uuid.uuid4()
-        instance2_data['id'] = uuid.uuid4()
+        component = valid_instance_data['component']
+        instance1_data = _instance_kwargs(valid_instance_data)
+        instance2_data = _instance_kwargs(valid_instance_data)
         
-        # Create instances with unique data
-        instance1 = ComponentInstance.objects.create(**instance1_data)
-        instance2 = ComponentInstance.objects.create(**instance2_data)
+        # Both rows go in one INSERT; internal_id comes from the sequence and
+        # the baseline data was already validated once per session
+        instance1, instance2 = _insert_validated_instances(
+            component, [instance1_data, instance2_data]
+        )
         
         return instance1, instance2
 
-    def _get_fresh_connection_data(self, valid_connection_data, valid_instance_data):
-        """Helper method to get fresh connection data with new instances."""
-        new_instances = self._create_fresh_instances(valid_instance_data)
+    def _build_fresh_instances_nosave(self, valid_instance_data):
+        """Helper method to build fresh, unsaved component instances."""
+        component = valid_instance_data['component']
+        instance1 = ComponentInstance(component=component, **_instance_kwargs(valid_instance_data))
+        instance2 = ComponentInstance(component=component, **_instance_kwargs(valid_instance_data))
+        return instance1, instance2
+
+    def _get_fresh_connection_data(self, valid_connection_data, valid_instance_data, save=True):
+        """
+        Helper method to get fresh connection data with new instances.
+        Pass save=False for tests that never query the instances.
+        """
+        if save:
+            new_instances = self._create_fresh_instances(valid_instance_data)
+        else:
+            new_instances = self._build_fresh_instances_nosave(valid_instance_data)
         fresh_data = valid_connection_data.copy()
         fresh_data['instance_1'] = new_instances[0]
         fresh_data['instance_2'] = new_instances[1]
@@ -121,46 +135,43 @@ class TestConnection:
         assert connection.spatial_bbox is not None
         assert connection.connection_type == ConnectionType.BOLTED.value
 
-    def test_invalid_spatial_relationship(self, valid_connection_data, valid_instance_data):
-        """Test validation of spatial relationship data."""
-        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        fresh_data['spatial_relationship'] = None
-        with pytest.raises(ValidationError):
-            Connection.objects.create(**fresh_data)
-
-    def test_grid_alignment_validation(self, valid_connection_data, valid_instance_data):
-        """Test 25mm grid alignment validation."""
-        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        # Create misaligned geometry
-        wkt = 'POLYGON Z ((0 0 0, 0 12.3 0, 12.3 12.3 0, 12.3 0 0, 0 0 0))'
-        fresh_data['spatial_relationship'] = GEOSGeometry(wkt, srid=4326)
-        
-        with pytest.raises(ValidationError):
-            Connection.objects.create(**fresh_data)
-
-    def test_connection_type_validation(self, valid_connection_data, valid_instance_data):
-        """Test validation of connection type and required properties."""
-        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        fresh_data['connection_properties'] = {'emi_shielding': True}
-        with pytest.raises(ValidationError):
-            Connection.objects.create(**fresh_data)
-
-    def test_emi_shielding_validation(self, valid_connection_data, valid_instance_data):
-        """Test EMI shielding property validation."""
+    @pytest.mark.parametrize('mutation', [
+        pytest.param({'spatial_relationship': None}, id='missing_spatial_relationship'),
+        pytest.param(
+            {'spatial_relationship': wkt_geom(MISALIGNED_WKT).clone()},
+            id='grid_misaligned'
+        ),
+        pytest.param({'connection_properties': {'emi_shielding': True}}, id='missing_required_properties'),
+        pytest.param(
+            {'connection_properties': {
+                'fastener_type': 'M8',
+                'torque_spec': '25Nm',
+                'strength': 'high',
+                'material': 'steel',
+                'emi_shielding': 'invalid'
+            }},
+            id='invalid_emi_shielding'
+        ),
+        pytest.param({'connection_properties': 'invalid'}, id='properties_not_dict'),
+    ])
+    def test_invalid_connection_data(self, mutation, valid_connection_data, valid_instance_data):
+        """Test that invalid spatial data or properties are rejected."""
         fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        fresh_data['connection_properties']['emi_shielding'] = 'invalid'
+        fresh_data.update(mutation)
         with pytest.raises(ValidationError):
             Connection.objects.create(**fresh_data)
 
     def test_status_update(self, valid_connection_data, valid_instance_data):
         """Test status update functionality."""
         fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        connection = Connection.objects.create(**fresh_data)
-        original_timestamp = connection.status_changed_at
-        
-        connection.update_status(ConnectionStatus.IN_PROGRESS.value)
+        with freeze_time('2024-01-01 00:00:00') as frozen:
+            connection = Connection.objects.create(**fresh_data)
+            original_timestamp = connection.status_changed_at
+            frozen.tick(delta=timedelta(seconds=1))
+            
+            connection.update_status(ConnectionStatus.IN_PROGRESS.value)
         assert connection.status == ConnectionStatus.IN_PROGRESS.value
-        assert connection.status_changed_at > original_timestamp
+        assert connection.status_changed_at == original_timestamp + timedelta(seconds=1)
 
     def test_temporal_validation(self, valid_connection_data, valid_instance_data):
         """Test temporal consistency validation."""
@@ -174,15 +185,30 @@ class TestConnection:
 
     def test_bounding_box_calculation(self, valid_connection_data, valid_instance_data):
         """Test automatic bounding box calculation."""
+        fresh_data = self._get_fresh_connection_data(
+            valid_connection_data, valid_instance_data, save=False
+        )
+        fresh_data['spatial_bbox'] = None
+        connection = Connection(**fresh_data)
+        connection.calculate_bounding_box()
+        assert connection.spatial_bbox is not None
+        assert connection.spatial_bbox.contains(connection.spatial_relationship)
+
+    def test_point_connection(self, valid_connection_data, valid_instance_data):
+        """Test a point connection still gets a polygon bounding box."""
         fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
+        fresh_data['spatial_relationship'] = Point(25, 50, 0, srid=4326)
         connection = Connection.objects.create(**fresh_data)
-        assert connection.spatial_bbox is not None
+        connection.refresh_from_db()
+        assert connection.spatial_bbox.geom_type == 'Polygon'
         assert connection.spatial_bbox.contains(connection.spatial_relationship)
 
     def test_invalid_status_update(self, valid_connection_data, valid_instance_data):
         """Test invalid status update handling."""
-        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        connection = Connection.objects.create(**fresh_data)
+        fresh_data = self._get_fresh_connection_data(
+            valid_connection_data, valid_instance_data, save=False
+        )
+        connection = Connection(**fresh_data)
         with pytest.raises(ValueError):
             connection.update_status('invalid_status')
 
@@ -212,14 +238,35 @@ class TestConnection:
 
     def test_str_representation(self, valid_connection_data, valid_instance_data):
         """Test string representation of connection."""
-        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        connection = Connection.objects.create(**fresh_data)
+        fresh_data = self._get_fresh_connection_data(
+            valid_connection_data, valid_instance_data, save=False
+        )
+        connection = Connection(**fresh_data)
         expected = f"Connection {connection.id} ({connection.connection_type}) between {connection.instance_1.id} and {connection.instance_2.id}"
         assert str(connection) == expected
 
-    def test_property_validation(self, valid_connection_data, valid_instance_data):
-        """Test connection properties validation."""
+    def test_overlapping_query(self, valid_connection_data, valid_instance_data):
+        """Test spatial overlap lookup with bounding box prefilter."""
         fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
-        fresh_data['connection_properties'] = 'invalid'
-        with pytest.raises(ValidationError):
-            Connection.objects.create(**fresh_data)
\ No newline at end of file
+        connection = Connection.objects.create(**fresh_data)
+
+        assert connection in Connection.objects.overlapping(connection.spatial_relationship)
+        assert connection in Connection.objects.bbox_overlapping(connection.spatial_relationship)
+
+        far_away = wkt_geom('POLYGON ((10000 10000, 10000 10025, 10025 10025, 10025 10000, 10000 10000))').clone()
+        assert not Connection.objects.overlapping(far_away).exists()
+
+    def test_bulk_update_status(self, valid_connection_data, valid_instance_data):
+        """Test updating the status of many connections at once."""
+        fresh_data = self._get_fresh_connection_data(valid_connection_data, valid_instance_data)
+        connection = Connection.objects.create(**fresh_data)
+
+        updated = Connection.objects.filter(pk=connection.pk).bulk_update_status(
+            ConnectionStatus.COMPLETE.value
+        )
+        assert updated == 1
+        connection.refresh_from_db()
+        assert connection.status == ConnectionStatus.COMPLETE.value
+
+        with pytest.raises(ValueError):
+            Connection.objects.bulk_update_status('invalid_status')
@@ -0,0 +1,46 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Test suite for the 25mm grid alignment helper.
+"""
+
+from django.contrib.gis.geos import LineString, MultiPolygon, Point, Polygon
+from core.models._grid import bounding_polygon, is_grid_aligned
+
+class TestGridAlignment:
+    """Test suite for is_grid_aligned()."""
+
+    def test_polygon(self):
+        """Test polygons are checked on their exterior ring."""
+        aligned = Polygon(((0, 0, 0), (0, 25, 0), (25, 25, 0), (25, 0, 0), (0, 0, 0)))
+        misaligned = Polygon(((0, 0, 0), (0, 12.3, 0), (12.3, 12.3, 0), (12.3, 0, 0), (0, 0, 0)))
+        assert is_grid_aligned(aligned)
+        assert not is_grid_aligned(misaligned)
+
+    def test_linestring_checks_every_vertex(self):
+        """Test a misaligned vertex after the first is still caught."""
+        assert is_grid_aligned(LineString((0, 0, 0), (25, 50, 3)))
+        assert not is_grid_aligned(LineString((0, 0, 0), (25, 50, 3), (30, 50, 3)))
+
+    def test_point_checks_x_and_y(self):
+        """Test both x and y of a point are checked, and z is ignored."""
+        assert is_grid_aligned(Point(25, 50, 7))
+        assert not is_grid_aligned(Point(25, 12.3, 0))
+
+    def test_multipolygon_with_hole(self):
+        """Test every ring of every member, with z free."""
+        shell = ((0, 0, 7), (0, 100, 7), (100, 100, 7), (100, 0, 7), (0, 0, 7))
+        hole = ((25, 25, 7), (25, 50, 7), (50, 50, 7), (25, 25, 7))
+        square = ((200, 0, 7), (200, 25, 7), (225, 25, 7), (225, 0, 7), (200, 0, 7))
+        assert is_grid_aligned(MultiPolygon(Polygon(shell, hole), Polygon(square)))
+
+        off_grid_hole = ((25, 25, 7), (25, 40, 7), (40, 40, 7), (25, 25, 7))
+        assert not is_grid_aligned(MultiPolygon(Polygon(shell, off_grid_hole), Polygon(square)))
+
+    def test_bounding_polygon_degenerate_extents(self):
+        """Test points and axis-parallel lines still get a polygon bbox."""
+        for geom in (Point(25, 50, 0, srid=4326), LineString((0, 0, 0), (0, 50, 0), srid=4326)):
+            bbox = bounding_polygon(geom)
+            assert bbox.geom_type == 'Polygon'
+            assert bbox.srid == 4326
+            assert bbox.contains(geom)
@@ -7,13 +7,7 @@ Test suite for the Parameter model.
 import pytest
 from django.core.exceptions import ValidationError
 import uuid
-from core.models import Parameter, Component
-from .test_component import valid_component_data
-
-@pytest.fixture
-def valid_component(valid_component_data):
-    """Fixture providing a valid component."""
-    return Component.objects.create(**valid_component_data)
+from core.models import Parameter
 
 @pytest.fixture
 def valid_parameter_data(valid_component):
@@ -49,15 +43,13 @@ class TestParameter:
         with pytest.raises(ValidationError):
             Parameter.objects.create(**valid_parameter_data)
 
-    def test_valid_ranges_validation(self, valid_parameter_data):
+    @pytest.mark.parametrize('valid_ranges', [
+        pytest.param([], id='invalid_type'),
+        pytest.param({'min': 0}, id='missing_max'),
+    ])
+    def test_valid_ranges_validation(self, valid_ranges, valid_parameter_data):
         """Test validation of valid_ranges field."""
-        # Test invalid type
-        valid_parameter_data['valid_ranges'] = []
-        with pytest.raises(ValidationError):
-            Parameter.objects.create(**valid_parameter_data)
-
-        # Test missing required keys
-        valid_parameter_data['valid_ranges'] = {'min': 0}  # missing 'max'
+        valid_parameter_data['valid_ranges'] = valid_ranges
         with pytest.raises(ValidationError):
             Parameter.objects.create(**valid_parameter_data)
 
@@ -112,6 +104,83 @@ class TestParameter:
         with pytest.raises(ValidationError):
             json_param.validate_value([1, 2, 3])
 
+    def test_validate_value_specialised(self, valid_parameter_data):
+        """Test the specialised validator is reused and rebuilt on change."""
+        valid_parameter_data.update({
+            'data_type': 'boolean',
+            'valid_ranges': {},
+            'units': None
+        })
+        bool_param = Parameter.objects.create(**valid_parameter_data)
+
+        assert bool_param.validate_value(True) is True
+        validator = bool_param._validator
+        assert bool_param.validate_value(False) is True
+        assert bool_param._validator is validator
+
+        with pytest.raises(ValidationError):
+            bool_param.validate_value(1)
+
+        bool_param.is_required = True
+        bool_param.clean()
+        assert bool_param._validator is not validator
+        with pytest.raises(ValidationError):
+            bool_param.validate_value(None)
+
+    def test_validate_array(self, valid_parameter_data):
+        """Test vectorised range and step validation."""
+        parameter = Parameter.objects.create(**valid_parameter_data)
+        mask = parameter.validate_array([0.0, 50.05, 99.9, 12.3, -0.1, 100.1])
+        assert mask.tolist() == [True, False, True, True, False, False]
+
+    def test_bulk_insert(self, valid_parameter_data):
+        """Test batch creation and name collision checks."""
+        params = [
+            Parameter(**dict(valid_parameter_data, name=f'param_{i}'))
+            for i in range(3)
+        ]
+        created = Parameter.bulk_insert(params)
+        assert len(created) == 3
+        assert Parameter.objects.count() == 3
+
+        with pytest.raises(ValidationError):
+            Parameter.bulk_insert([Parameter(**dict(valid_parameter_data, name='param_0'))])
+        assert Parameter.objects.count() == 3
+
+    def test_lightweight(self, valid_parameter_data, django_assert_num_queries):
+        """Test list queries skip heavy columns."""
+        Parameter.objects.create(**valid_parameter_data)
+        parameter = Parameter.objects.lightweight().get()
+        assert {'valid_ranges', 'description'} <= parameter.get_deferred_fields()
+        assert parameter.name == valid_parameter_data['name']
+
+        # Range checks run from the loaded columns without deferred loads
+        with django_assert_num_queries(0):
+            assert parameter.validate_value(50.0) is True
+            with pytest.raises(ValidationError):
+                parameter.validate_value(150.0)
+
+    def test_range_columns_follow_valid_ranges(self, valid_parameter_data):
+        """Test the range columns track valid_ranges on writes that bypass clean()."""
+        parameter = Parameter.objects.create(**valid_parameter_data)
+        Parameter.objects.filter(pk=parameter.pk).update(
+            valid_ranges={'min': 10, 'max': 20, 'step': 1}
+        )
+        parameter.refresh_from_db()
+        assert (parameter.min_value, parameter.max_value, parameter.step_value) == (10, 20, 1)
+        with pytest.raises(ValidationError):
+            parameter.validate_value(50.0)
+
+    def test_validate_value_uncleaned(self):
+        """Test unsaved, uncleaned definitions still enforce valid_ranges."""
+        parameter = Parameter(
+            name='wall_thickness', data_type='float', units='mm',
+            valid_ranges={'min': 0, 'max': 100}
+        )
+        with pytest.raises(ValidationError):
+            parameter.validate_value(150)
+        assert parameter.validate_array([50.0, 150.0]).tolist() == [True, False]
+
     def test_unique_constraint(self, valid_parameter_data):
         """Test unique constraint on component and name."""
         Parameter.objects.create(**valid_parameter_data)
@@ -0,0 +1,31 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Test suite for the UUIDv7 generator.
+"""
+
+import time
+import uuid
+from core.utils.uuid7 import uuid7
+
+class TestUUID7:
+    """Test suite for uuid7()."""
+
+    def test_version_and_variant(self):
+        """Test the version and variant bits."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embedded_timestamp(self):
+        """Test the leading 48 bits carry the current Unix time in ms."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_monotonic(self):
+        """Test consecutive values sort in generation order."""
+        values = [uuid7() for _ in range(5000)]
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
@@ -9,20 +9,13 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
 import uuid
-from core.models import ParameterValue, Parameter, ComponentInstance, Component
-from .test_component import valid_component_data
+from core.models import ParameterValue, Parameter, ComponentInstance
 
-@pytest.fixture
-def valid_component(valid_component_data):
-    """Fixture providing a valid component."""
-    return Component.objects.create(**valid_component_data)
-
-@pytest.fixture
-def valid_parameter(valid_component):
-    """Fixture providing a valid parameter."""
+def _create_parameter(component, name='wall_thickness'):
+    """Create the 0-100mm parameter used throughout this module."""
     return Parameter.objects.create(
-        component=valid_component,
-        name='wall_thickness',
+        component=component,
+        name=name,
         data_type='float',
         units='mm',
         valid_ranges={
@@ -34,51 +27,65 @@ def valid_parameter(valid_component):
         description='Wall thickness in millimeters'
     )
 
-@pytest.fixture
-def valid_instance(valid_component):
-    """Fixture providing a valid component instance."""
-    from django.contrib.gis.geos import GEOSGeometry
-    
-    # Create a simple 3D polygon for testing
-    wkt = 'POLYGON Z ((0 0 0, 0 25 0, 25 25 0, 25 0 0, 0 0 0))'
-    geometry = GEOSGeometry(wkt, srid=4326)
-    
+def _create_instance(component, base_polygon, base_bbox):
+    """Create the component instance used throughout this module."""
     return ComponentInstance.objects.create(
-        component=valid_component,
-        spatial_data=geometry,
-        spatial_bbox=geometry.envelope,
+        component=component,
+        spatial_data=base_polygon.clone(),
+        spatial_bbox=base_bbox.clone(),
         instance_properties={
             'test_property': 'test_value'  # Non-empty properties
         },
-        internal_id=1,
         created_at=timezone.now()
     )
 
-@pytest.fixture
-def valid_parameter_value_data(valid_instance, valid_parameter, test_user):
-    """Fixture providing valid parameter value data."""
+def _parameter_value_data(instance, parameter, user):
+    """Build valid parameter value field values."""
     return {
-        'instance': valid_instance,
-        'parameter': valid_parameter,
+        'instance': instance,
+        'parameter': parameter,
         'value': {
             'value': 50.0,
             'unit': 'mm'
         },
         'validation_status': 'pending',
         'recorded_at': timezone.now(),
-        'modified_by': test_user
+        'modified_by': user
     }
 
 @pytest.fixture
-def test_user():
-    """Fixture providing a test user."""
-    from django.contrib.auth import get_user_model
-    User = get_user_model()
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )    
+def valid_parameter(valid_component):
+    """Fixture providing a valid parameter."""
+    return _create_parameter(valid_component)
+
+@pytest.fixture
+def valid_instance(valid_component, base_polygon, base_bbox):
+    """Fixture providing a valid component instance."""
+    return _create_instance(valid_component, base_polygon, base_bbox)
+
+@pytest.fixture
+def valid_parameter_value_data(valid_instance, valid_parameter, test_user):
+    """Fixture providing valid parameter value data."""
+    return _parameter_value_data(valid_instance, valid_parameter, test_user)
+
+@pytest.fixture(scope='class')
+def stored_parameter_value(class_transaction, valid_component, base_polygon,
+                           base_bbox, test_user):
+    """
+    Fixture providing one validated, saved parameter value per test class.
+
+    The row lives in the class transaction, so tests take their own copy with
+    ParameterValue.objects.get(pk=...) and any changes they make are rolled
+    back with their per-test savepoint.
+    """
+    def create():
+        instance = _create_instance(valid_component, base_polygon, base_bbox)
+        parameter = _create_parameter(valid_component)
+        return ParameterValue.objects.create(
+            **_parameter_value_data(instance, parameter, test_user)
+        )
+
+    return class_transaction(create)
 
 @pytest.mark.django_db
 class TestParameterValue:
@@ -101,15 +108,13 @@ class TestParameterValue:
             ParameterValue.objects.create(**valid_parameter_value_data)
         assert 'recorded_at' in str(exc.value)
 
-    def test_value_constraints(self, valid_parameter_value_data):
+    @pytest.mark.parametrize('bad_value', [
+        pytest.param(150.0, id='above_max'),
+        pytest.param(50.05, id='off_step'),
+    ])
+    def test_value_constraints(self, bad_value, valid_parameter_value_data):
         """Test value constraint validation."""
-        # Test value outside valid range
-        valid_parameter_value_data['value']['value'] = 150.0  # Above max
-        with pytest.raises(ValidationError):
-            ParameterValue.objects.create(**valid_parameter_value_data)
-
-        # Test invalid step
-        valid_parameter_value_data['value']['value'] = 50.05  # Not a valid step
+        valid_parameter_value_data['value']['value'] = bad_value
         with pytest.raises(ValidationError):
             ParameterValue.objects.create(**valid_parameter_value_data)
 
@@ -119,15 +124,13 @@ class TestParameterValue:
         with pytest.raises(ValidationError):
             ParameterValue.objects.create(**valid_parameter_value_data)
 
-    def test_unit_validation(self, valid_parameter_value_data):
+    @pytest.mark.parametrize('bad_value', [
+        pytest.param({'value': 50.0, 'unit': 'cm'}, id='wrong_unit'),
+        pytest.param({'value': 50.0}, id='missing_unit'),
+    ])
+    def test_unit_validation(self, bad_value, valid_parameter_value_data):
         """Test unit validation."""
-        # Test invalid unit
-        valid_parameter_value_data['value']['unit'] = 'cm'
-        with pytest.raises(ValidationError):
-            ParameterValue.objects.create(**valid_parameter_value_data)
-
-        # Test missing unit
-        valid_parameter_value_data['value'].pop('unit')
+        valid_parameter_value_data['value'] = bad_value
         with pytest.raises(ValidationError):
             ParameterValue.objects.create(**valid_parameter_value_data)
 
@@ -137,14 +140,42 @@ class TestParameterValue:
         with pytest.raises(ValidationError):
             ParameterValue.objects.create(**valid_parameter_value_data)
 
-    def test_get_value(self, valid_parameter_value_data):
+    def test_bulk_insert(self, valid_parameter_value_data, valid_component):
+        """Test batch creation, with ranges enforced by the database trigger."""
+        created = ParameterValue.bulk_insert([ParameterValue(**valid_parameter_value_data)])
+        assert created[0].validation_status == 'valid'
+        assert ParameterValue.objects.count() == 1
+
+        # A second parameter keeps (instance, parameter) unique, so only the
+        # et_parameter_value_range trigger can reject the out-of-range row
+        valid_parameter_value_data['parameter'] = _create_parameter(
+            valid_component, name='wall_height'
+        )
+        valid_parameter_value_data['value'] = {'value': 150.0, 'unit': 'mm'}  # Above max
+        with pytest.raises(ValidationError):
+            ParameterValue.bulk_insert([ParameterValue(**valid_parameter_value_data)])
+        assert ParameterValue.objects.count() == 1
+
+        valid_parameter_value_data['value'] = {'value': 75.0, 'unit': 'mm'}
+        ParameterValue.bulk_insert([ParameterValue(**valid_parameter_value_data)])
+        assert ParameterValue.objects.count() == 2
+
+@pytest.mark.django_db
+class TestStoredParameterValue:
+    """Tests that only need an existing, valid parameter value."""
+
+    def _fetch(self, stored_parameter_value):
+        """Return a fresh copy of the shared parameter value."""
+        return ParameterValue.objects.get(pk=stored_parameter_value.pk)
+
+    def test_get_value(self, stored_parameter_value):
         """Test get_value method."""
-        value = ParameterValue.objects.create(**valid_parameter_value_data)
+        value = self._fetch(stored_parameter_value)
         assert value.get_value() == 50.0
 
-    def test_set_value(self, valid_parameter_value_data):
+    def test_set_value(self, stored_parameter_value):
         """Test set_value method."""
-        value = ParameterValue.objects.create(**valid_parameter_value_data)
+        value = self._fetch(stored_parameter_value)
         
         # Test valid value update
         value.set_value(75.0, 'mm')
@@ -159,9 +190,9 @@ class TestParameterValue:
         with pytest.raises(ValidationError):
             value.set_value(75.0, 'cm')
 
-    def test_validation_status_updates(self, valid_parameter_value_data):
+    def test_validation_status_updates(self, stored_parameter_value):
         """Test validation status updates."""
-        value = ParameterValue.objects.create(**valid_parameter_value_data)
+        value = self._fetch(stored_parameter_value)
         assert value.validation_status == 'valid'
 
         # Simulate invalid update
@@ -171,18 +202,40 @@ class TestParameterValue:
             pass
         assert value.validation_status == 'invalid'
 
-    def test_str_representation(self, valid_parameter_value_data):
+    def test_str_representation(self, stored_parameter_value):
         """Test string representation."""
-        value = ParameterValue.objects.create(**valid_parameter_value_data)
+        value = self._fetch(stored_parameter_value)
         expected = f"wall_thickness = 50.0 (valid)"
         assert str(value) == expected
 
-    def test_audit_timestamps(self, valid_parameter_value_data):
+    def test_with_related(self, stored_parameter_value, django_assert_num_queries):
+        """Test that related rows are joined into a single query."""
+        with django_assert_num_queries(1):
+            for value in ParameterValue.objects.with_related():
+                str(value)
+                value.instance.created_at
+
+    def test_with_names(self, stored_parameter_value, django_assert_num_queries):
+        """Test string rendering from the annotated parameter name."""
+        with django_assert_num_queries(1):
+            assert [str(v) for v in ParameterValue.objects.with_names()] == [
+                "wall_thickness = 50.0 (valid)"
+            ]
+
+    def test_value_queries(self, stored_parameter_value):
+        """Test JSONB containment and numeric threshold lookups."""
+        value = self._fetch(stored_parameter_value)
+        assert list(ParameterValue.objects.with_value(50.0)) == [value]
+        assert not ParameterValue.objects.with_value(75.0).exists()
+        assert list(ParameterValue.objects.numeric_gte(50)) == [value]
+        assert not ParameterValue.objects.numeric_gte(50.1).exists()
+
+    def test_audit_timestamps(self, stored_parameter_value):
         """Test automatic timestamp updates."""
-        value = ParameterValue.objects.create(**valid_parameter_value_data)
+        value = self._fetch(stored_parameter_value)
         assert value.created_at
         assert value.modified_at
         
         original_modified = value.modified_at
         value.set_value(75.0, 'mm')
-        assert value.modified_at > original_modified
\ No newline at end of file
+        assert value.modified_at > original_modified
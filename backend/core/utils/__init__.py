@@ -0,0 +1,5 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Shared helpers for the core app.
+"""
@@ -0,0 +1,50 @@
+"""EuroTempl System
+Copyright (c) 2024 Pygmalion Records
+
+Time-ordered UUID version 7 generation (RFC 9562), used as primary key default
+so new rows append to the right edge of B-tree indexes instead of landing on
+random leaf pages.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7.
+
+    Layout: 48-bit Unix timestamp in milliseconds, version, 12-bit counter,
+    variant, 62 random bits. The counter starts at a random point each
+    millisecond and increments within it, so values from this process are
+    strictly increasing.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # Seed from the lower half so a burst has room to count up
+            _counter = int.from_bytes(os.urandom(2), 'big') & 0x7FF
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                # Counter exhausted (or clock went backwards): borrow the next millisecond
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)